@@ -1,67 +1,123 @@
-import os
+import re
 import sys
+import asyncio
+import logging
+import threading
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Import our custom modules from the 'utils' package
 from utils.ingestor import ingest_company_data
 from utils.agent import analyze_data
-from utils.web_search import get_web_data_for_company
-from utils.generator import create_presentation
+from utils.web_search import get_web_data_for_company, merge_web_data
+from utils.generator import create_presentation_with_status, load_template, DEBUG
+from utils.pipeline_cache import (
+    hash_input_files, make_pipeline_key, restore_cached_output, store_output,
+    load_manifest, manifest_web_data, save_manifest
+)
 
 # Load API Keys (specifically GOOGLE_API_KEY)
 load_dotenv()
 
-def run_pipeline(company_folder_name):
+def is_same_company(name_a, name_b):
     """
-    Orchestrates the full process:
-    1. Read Data -> 2. AI Analysis -> 3. Web Search -> 4. Generate PPT
+    Loose company-name match: True if one name's words are a subset of the other's
+    (e.g. "Kalyani Forge" vs "Kalyani Forge Ltd"). Unknown/empty names count as a match.
     """
-    print(f"\n🚀 STARTING PIPELINE FOR: {company_folder_name}")
-    print("=" * 50)
+    words_a = set(re.findall(r"[a-z0-9]+", str(name_a).lower()))
+    words_b = set(re.findall(r"[a-z0-9]+", str(name_b).lower()))
+    if not words_a or not words_b or words_a == {"unknown"} or words_b == {"unknown"}:
+        return True
+    return words_a <= words_b or words_b <= words_a
 
-    # --- SETUP PATHS ---
-    # Define where inputs live and where outputs go
-    base_dir = os.getcwd()
-    input_dir = os.path.join(base_dir, "data", "input", company_folder_name)
-    output_dir = os.path.join(base_dir, "data", "output")
-    
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Define final PPT output path
-    output_pptx_path = os.path.join(output_dir, f"{company_folder_name}_Teaser.pptx")
+def run_in_daemon_thread(func, *args):
+    """
+    Like asyncio.to_thread(), but the work runs in a daemon thread instead of the loop's
+    default executor. asyncio.run() (and interpreter exit) never waits for it, so a
+    speculative call can be abandoned by cancelling the returned future.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(result, error):
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
 
+    def _worker():
+        result, error = None, None
+        try:
+            result = func(*args)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(_resolve, result, error)
+        except RuntimeError:
+            pass  # The event loop is already closed: nobody is waiting for the result
+
+    threading.Thread(target=_worker, daemon=True).start()
+    return future
+
+async def gather_company_data(company_folder_name, input_dir):
+    """
+    Steps 1-3: ingests the documents, analyzes them with Gemini and gathers web data.
+    Returns (structured_data with 'web_data' attached, preloaded template or None,
+    whether the web search succeeded), or (None, None, False) on a critical failure.
+    """
     # --- STEP 1: INGESTION ---
     print(f"\n📂 Step 1: Ingesting documents from '{input_dir}'...")
-    raw_text = ingest_company_data(input_dir)
+    raw_text = await asyncio.to_thread(ingest_company_data, input_dir)
     
     if not raw_text or len(raw_text) < 50:
         print("❌ CRITICAL FAILURE: No text extracted. Check your input folder path.")
-        return
+        return None, None, False
 
     print(f"   -> Success! Extracted {len(raw_text)} characters of text.")
 
-    # --- STEP 2: AI ANALYSIS ---
+    # --- STEP 2 + 3: AI ANALYSIS and WEB SEARCH (overlapped) ---
+    # Web search only needs a company name, so it starts right away with the folder name
+    # while Gemini runs; the PPT template is loaded alongside both.
+    search_name = company_folder_name.replace('_', ' ')
     print(f"\n🧠 Step 2: Sending data to Gemini (Agent)...")
-    structured_data = analyze_data(raw_text)
+    print(f"🌐 Step 3: Gathering web data (images, certifications, business info) for '{search_name}'...")
+    analysis_task = asyncio.ensure_future(asyncio.to_thread(analyze_data, raw_text))
+    web_task = run_in_daemon_thread(get_web_data_for_company, search_name, raw_text)
+    template_task = run_in_daemon_thread(load_template)
+
+    structured_data = await analysis_task
     
     if not structured_data:
         print("❌ CRITICAL FAILURE: AI Agent failed to return data.")
-        return
+        # Don't wait for the speculative work: the run is over
+        web_task.cancel()
+        template_task.cancel()
+        return None, None, False
 
     codename = structured_data.get('company_codename', 'Unknown Project')
-    company_name = structured_data.get('company_name', company_folder_name)
+    company_name = structured_data.get('company_name', search_name)
     print(f"   -> Success! Analysis complete for '{codename}'.")
 
-    # --- STEP 3: WEB SEARCH ---
-    print(f"\n🌐 Step 3: Gathering web data (images, certifications, business info)...")
-    try:
-        web_data = get_web_data_for_company(company_name, raw_text)
-        # Add web data to structured_data for use in presentation
-        structured_data['web_data'] = web_data
-        print(f"   -> Success! Web search complete.")
-    except Exception as e:
-        print(f"⚠️  Web search error: {e}")
+    refine_task = None
+    if not is_same_company(company_name, search_name):
+        # The folder name was a poor guess -> also search with the name Gemini extracted.
+        # Started now, so it overlaps the optimistic search instead of queueing behind it
+        # (queries both searches share are served from the HTTP response cache).
+        print(f"   -> Company identified as '{company_name}', refining web search...")
+        refine_task = run_in_daemon_thread(get_web_data_for_company, company_name, raw_text)
+
+    web_data, template_prs = await asyncio.gather(web_task, template_task, return_exceptions=True)
+    if refine_task is not None:
+        try:
+            canonical_web_data = await refine_task
+            web_data = canonical_web_data if isinstance(web_data, Exception) else merge_web_data(canonical_web_data, web_data)
+        except Exception as e:
+            print(f"⚠️  Refined web search error: {e}")
+
+    if isinstance(web_data, Exception):
+        print(f"⚠️  Web search error: {web_data}")
         print(f"   -> Continuing without web data...")
         structured_data['web_data'] = {
             'images': [],
@@ -69,12 +125,84 @@ def run_pipeline(company_folder_name):
             'business_info': {},
             'citations': []
         }
+        web_ok = False
+    else:
+        # Add web data to structured_data for use in presentation
+        structured_data['web_data'] = web_data
+        # The searches catch their own errors, so failures only show up in this flag
+        web_ok = bool(web_data.get('web_ok'))
+        print(f"   -> Success! Web search complete." if web_ok else "   -> Web search finished with missing results.")
+    if isinstance(template_prs, Exception):
+        template_prs = None
+
+    return structured_data, template_prs, web_ok
+
+async def run_pipeline(company_folder_name):
+    """
+    Orchestrates the full process:
+    1. Read Data -> 2. AI Analysis -> 3. Web Search -> 4. Generate PPT
+    Blocking stages run in worker threads so independent network/disk work can overlap.
+    """
+    print(f"\n🚀 STARTING PIPELINE FOR: {company_folder_name}")
+    print("=" * 50)
+
+    # --- SETUP PATHS ---
+    # Define where inputs live and where outputs go
+    base_dir = Path.cwd()
+    input_dir = base_dir / "data" / "input" / company_folder_name
+    output_dir = base_dir / "data" / "output"
+    
+    # Ensure output directory exists
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Define final PPT output path
+    output_pptx_path = str(output_dir / f"{company_folder_name}_Teaser.pptx")
+
+    # --- CACHE CHECK: identical inputs + template -> reuse the previously generated deck ---
+    try:
+        file_hashes = await asyncio.to_thread(hash_input_files, input_dir)
+        input_key = make_pipeline_key(file_hashes)
+    except OSError as e:
+        print(f"⚠️  Could not fingerprint inputs ({e}), running without the pipeline cache.")
+        file_hashes = input_key = None
+    cached_path = restore_cached_output(input_key, output_pptx_path) if input_key else None
+    if cached_path:
+        print("\n⚡ Inputs and template unchanged since the last run. Reusing the cached presentation.")
+        print("=" * 50)
+        print(f"✅ PIPELINE COMPLETE. Output file:\n   {cached_path}")
+        print("=" * 50)
+        return
+
+    # --- STEPS 1-3: reuse the previous run's outputs if no input file changed ---
+    manifest_path = str(output_dir / f"{company_folder_name}_manifest.json")
+    manifest = load_manifest(manifest_path) if file_hashes else None
+    cached_web_data = manifest_web_data(manifest) if manifest and manifest.get('files') == file_hashes else None
+    if cached_web_data is not None:
+        print("\n⚡ Input files unchanged since the last run. Reusing analysis and web data (Steps 1-3 skipped).")
+        structured_data = manifest['structured_data']
+        structured_data['web_data'] = cached_web_data
+        template_prs = None
+        web_ok = True
+    else:
+        structured_data, template_prs, web_ok = await gather_company_data(company_folder_name, input_dir)
+        if not structured_data:
+            return
+        # Don't persist the agent's placeholder result for unparseable Gemini output
+        if structured_data.get('company_codename') == "Project Error":
+            file_hashes = input_key = None
+        if file_hashes:
+            save_manifest(manifest_path, file_hashes, structured_data, web_ok)
 
     # --- STEP 4: GENERATION ---
     print(f"\n🎨 Step 4: Generating PowerPoint slides...")
     try:
-        create_presentation(structured_data, output_pptx_path)
+        output_pptx_path, used_template = await asyncio.to_thread(
+            create_presentation_with_status, structured_data, output_pptx_path, template_prs
+        )
         print(f"   -> Success! PPT Saved.")
+        # A deck built without web data or by the programmatic fallback is not worth replaying
+        if input_key and web_ok and used_template:
+            store_output(input_key, output_pptx_path)
     except Exception as e:
         print(f"❌ GENERATOR ERROR: {e}")
         return
@@ -84,6 +212,11 @@ def run_pipeline(company_folder_name):
     print("=" * 50)
 
 if __name__ == "__main__":
+    # Generator trace output goes through logging: warnings only, unless KELP_DEBUG is set
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    if DEBUG:
+        logging.getLogger("utils").setLevel(logging.DEBUG)
+
     # --- USAGE INSTRUCTIONS ---
     # You can run this file in two ways:
     # 1. python main.py                  (Runs default test)
@@ -97,8 +230,8 @@ if __name__ == "__main__":
         target_company = "Test_Company"
 
     # Check if the folder actually exists before running
-    if os.path.exists(os.path.join("data", "input", target_company)):
-        run_pipeline(target_company)
+    if Path("data", "input", target_company).is_dir():
+        asyncio.run(run_pipeline(target_company))
     else:
         print(f"❌ Error: The folder 'data/input/{target_company}' does not exist.")
         print("   Please create it and put your PDF/Text files inside.")
\ No newline at end of file
@@ -6,6 +6,7 @@ Run this file to test the web search functionality independently.
 
 import os
 import sys
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Import our custom modules from the 'utils' package
@@ -26,11 +27,10 @@ def test_web_search(company_folder_name):
     print("=" * 70)
     
     # --- SETUP PATHS ---
-    base_dir = os.getcwd()
-    input_dir = os.path.join(base_dir, "data", "input", company_folder_name)
+    input_dir = Path.cwd() / "data" / "input" / company_folder_name
     
     # Check if folder exists
-    if not os.path.exists(input_dir):
+    if not input_dir.is_dir():
         print(f"❌ Error: The folder 'data/input/{company_folder_name}' does not exist.")
         print("   Please create it and put your PDF/Text files inside.")
         return None
@@ -204,9 +204,10 @@ if __name__ == "__main__":
     else:
         # List available companies
         input_dir = os.path.join("data", "input")
-        if os.path.exists(input_dir):
-            companies = [d for d in os.listdir(input_dir) 
-                        if os.path.isdir(os.path.join(input_dir, d)) and not d.startswith('.')]
+        if os.path.isdir(input_dir):
+            # scandir's DirEntry caches the file type, so no extra stat per entry
+            with os.scandir(input_dir) as it:
+                companies = [e.name for e in it if e.is_dir() and not e.name.startswith('.')]
             if companies:
                 print("📂 Available companies:")
                 for i, company in enumerate(companies, 1):
@@ -1,8 +1,10 @@
 import os
-import json
+from functools import lru_cache
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
+from utils import serde
+from utils.llm_cache import make_cache_key, get_cached_response, store_response
 
 # Load environment variables
 load_dotenv()
@@ -10,26 +12,15 @@ load_dotenv()
 def clean_json_string(json_string):
     """
     Cleans the LLM output to ensure it is valid JSON.
+    Slices from the first '{' to the last '}', which drops ```json fences and any stray prose.
     """
-    if "```" in json_string:
-        json_string = json_string.replace("```json", "").replace("```", "")
-    return json_string.strip()
+    i = json_string.find('{')
+    j = json_string.rfind('}')
+    return json_string[i:j + 1] if i != -1 and j > i else json_string.strip()
 
-def analyze_data(raw_text):
-    """
-    Sends the raw text to Gemini and asks for a structured JSON output.
-    """
-    
-    # --- FIX: SWITCH TO GEMINI-PRO (STABLE) ---
-    # The error "404 model not found" often happens with new aliases like 'flash'.
-    # 'gemini-pro' is the standard v1.0 model and is extremely stable.
-    llm = ChatGoogleGenerativeAI(
-        model="models/gemini-2.5-flash-lite", 
-        temperature=0.2,
-        google_api_key=os.getenv("GOOGLE_API_KEY")
-    )
-
-    prompt_template = """
+# The invariant instructions + JSON schema come first and {raw_text} last, so every call
+# shares the same prompt prefix and Gemini's implicit context caching can reuse it.
+ANALYSIS_PROMPT_TEMPLATE = """
     You are an expert M&A Analyst at Kelp Global.
     Your task is to analyze the provided raw company data and extract specific information to build a 3-slide "Investment Teaser".
     
@@ -38,10 +29,6 @@ def analyze_data(raw_text):
     2. **Factuality**: Only use data present in the provided text. If a metric is missing, estimate it based on context or mark as "N/A".
     3. **Output Format**: You must output ONLY valid JSON. No Markdown formatting, no extra text.
     
-    --- RAW DATA START ---
-    {raw_text}
-    --- RAW DATA END ---
-
     Return a JSON object with this EXACT structure:
     {{
         "company_name": "Extract the actual company name from the data",
@@ -80,29 +67,74 @@ def analyze_data(raw_text):
             "Highlight 3"
         ]
     }}
+
+    --- RAW DATA START ---
+    {raw_text}
+    --- RAW DATA END ---
     """
-    
+
+@lru_cache(maxsize=1)
+def _get_chain():
+    """
+    Builds the Gemini model + prompt chain once and reuses it for every analyze_data call.
+    """
+    # --- FIX: SWITCH TO GEMINI-PRO (STABLE) ---
+    # The error "404 model not found" often happens with new aliases like 'flash'.
+    # 'gemini-pro' is the standard v1.0 model and is extremely stable.
+    llm = ChatGoogleGenerativeAI(
+        model="models/gemini-2.5-flash-lite", 
+        temperature=0.2,
+        google_api_key=os.getenv("GOOGLE_API_KEY")
+    )
+
     prompt = PromptTemplate(
         input_variables=["raw_text"],
-        template=prompt_template
+        template=ANALYSIS_PROMPT_TEMPLATE
     )
+    return prompt | llm
 
+def analyze_data(raw_text):
+    """
+    Sends the raw text to Gemini and asks for a structured JSON output.
+    Repeat inputs are served from the local LLM cache without calling Gemini.
+    """
+    
+    # --- CACHE LOOKUP: skip the Gemini round trip for inputs we've already analyzed ---
+    # The prompt is part of the key so editing it invalidates stale analyses
+    cache_key = make_cache_key(ANALYSIS_PROMPT_TEMPLATE + raw_text)
+    cached_json = get_cached_response(cache_key)
+    if cached_json:
+        try:
+            data = serde.loads(cached_json)
+        except serde.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            print(f"⚡ AI Agent: Using cached analysis. Codename: {data.get('company_codename')}")
+            return data
+        print("⚠️  Cached analysis is corrupt, re-running Gemini...")
+    
     print("🧠 AI Agent: Analyzing data with Gemini Pro...")
-    chain = prompt | llm
     
     try:
-        response = chain.invoke({"raw_text": raw_text})
-        
-        # Handle response content type (sometimes it's an object, sometimes a string)
-        content = response.content if hasattr(response, 'content') else str(response)
+        # Stream the response and join the chunks once it completes.
+        # `.text` flattens both plain-string and content-block chunks into a string.
+        content = "".join(
+            chunk.text if hasattr(chunk, 'text') else str(chunk)
+            for chunk in _get_chain().stream({"raw_text": raw_text})
+        )
         
         cleaned_json = clean_json_string(content)
-        data = json.loads(cleaned_json)
+        data = serde.loads(cleaned_json)
+        if not isinstance(data, dict):
+            # Valid JSON but not the expected object: don't cache it
+            print(f"❌ JSON Error: AI output was a {type(data).__name__}, not a JSON object.")
+            return None
+        store_response(cache_key, cleaned_json)
         
         print(f"✅ Analysis Complete. Codename: {data.get('company_codename')}")
         return data
         
-    except json.JSONDecodeError:
+    except serde.JSONDecodeError:
         print("❌ JSON Error: AI output was not valid JSON.")
         return {
             "company_name": "Unknown",
@@ -21,11 +21,17 @@ Why Template-Driven?
 
 import os
 import re
-import requests
-import tempfile
-import shutil
+import asyncio
+import threading
+from functools import lru_cache
+import io
+import logging
+from typing import List, Optional
+import aiohttp
 from pptx import Presentation
 from pptx.util import Inches, Pt
+from pptx.oxml.ns import qn
+from lxml import etree
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.shapes import MSO_SHAPE_TYPE, MSO_SHAPE
@@ -33,11 +39,29 @@ from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
 from PIL import Image
 
+# Optional: google-re2 (linear-time DFA regex engine) for markdown stripping; stdlib re otherwise
+try:
+    import re2 as markdown_re
+except ImportError:
+    markdown_re = re
+
+log = logging.getLogger(__name__)
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
 TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "templates", "template.pptx")
 
+# Set KELP_DEBUG=1 to print every slide's placeholder layout during generation
+DEBUG = os.getenv("KELP_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Raw template bytes keyed by (absolute path, mtime), read once and shared by every create_presentation call
+_TEMPLATE_BYTES = {}
+_TEMPLATE_LOCK = threading.Lock()
+
+# Placeholder (width, height) in EMU keyed by template key, then (slide index, placeholder idx)
+_SLIDE_GEOMETRY = {}
+
 # Branding Colors
 KELP_INDIGO = RGBColor(45, 0, 75)
 KELP_PINK = RGBColor(255, 0, 127)
@@ -46,21 +70,56 @@ KELP_WHITE = RGBColor(255, 255, 255)
 KELP_GREY_TEXT = RGBColor(80, 80, 80)
 KELP_LIGHT_GREY_BG = RGBColor(245, 245, 245)
 
-# Temporary directory for downloaded images
-TEMP_IMAGE_DIR = None
+# HTTP settings for image downloads
+IMAGE_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+IMAGE_DOWNLOAD_TIMEOUT = 10
+IMAGE_DOWNLOAD_CONNECTIONS = 32
+
+# Image formats python-pptx can embed
+SLIDE_IMAGE_FORMATS = {"JPEG", "PNG", "GIF", "BMP", "TIFF"}
+
+# Wider downloaded images are downscaled before insertion
+SLIDE_IMAGE_MAX_WIDTH = 800
+
+# Markdown bold/italic markers (** and *) stripped from LLM text
+_MARKDOWN_EMPHASIS_RE = markdown_re.compile(r'\*+')
+
+# Text placeholder layout (Length objects are immutable ints, so they can be shared)
+EMU_PER_PT = 12700
+_TEXT_MARGIN_X = Inches(0.1)
+_TEXT_MARGIN_Y = Inches(0.05)
+_PARAGRAPH_SPACING_CPTS = "400"  # 4pt space after each paragraph, in 1/100 pt
+_TEXT_FONT_NAME = "Arial"
+
+# Written into text placeholders that have no data, so the layout's {{marker}} prompt never shows
+_EMPTY_TEXT_FILL = "N/A"
+
+# Average Arial glyph advance for mixed-case text is ~0.5em; line pitch is ~1.2em
+ARIAL_AVG_CHAR_EM = 0.5
+LINE_HEIGHT_FACTOR = 1.2
+
+# XML-invalid control characters, escaped the same way python-pptx does ("_x0007_")
+_CTRL_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x1F]')
+
+# Words for wrap_text()
+_WORD_RE = re.compile(r'\S+')
 
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
+@lru_cache(maxsize=4096)
+def _strip_markdown(text):
+    """Single-pass markdown strip, memoized since the same bullets recur across slides."""
+    return _MARKDOWN_EMPHASIS_RE.sub('', text).strip()
+
 def clean_text(text):
     """Removes markdown and cleans text for presentation."""
     if not text:
         return ""
     if isinstance(text, (int, float)):
         return str(text)
-    text = str(text).replace("**", "").replace("*", "").strip()
-    return text
+    return _strip_markdown(str(text))
 
 def format_list(items, max_items=None, bullet="•"):
     """Formats a list of items into a bulleted string."""
@@ -95,31 +154,87 @@ def get_unique_output_path(output_path):
         if counter > 1000:
             raise ValueError("Too many files with similar names exist")
 
-def download_image_to_temp(image_url: str, filename: str) -> str:
-    """Downloads an image from URL and saves it to a temporary file."""
-    global TEMP_IMAGE_DIR
-    
-    if not TEMP_IMAGE_DIR:
-        TEMP_IMAGE_DIR = tempfile.mkdtemp(prefix="kelp_images_")
-    
+def _resize_for_slide(image_buffer: io.BytesIO, max_width: int = SLIDE_IMAGE_MAX_WIDTH) -> io.BytesIO:
+    """
+    Downscales a JPEG/PNG wider than max_width (aspect ratio kept).
+    Slide logos are only a couple of inches wide, so full-size photos just bloat the deck.
+    Returns a new buffer, or the original one if no resize was needed or possible.
+    """
+    try:
+        with Image.open(image_buffer) as img:
+            if img.width <= max_width or img.format not in ("JPEG", "PNG"):
+                image_buffer.seek(0)
+                return image_buffer
+            
+            img_format = img.format
+            target_size = (max_width, max(1, img.height * max_width // img.width))
+            # For JPEGs, let the decoder do most of the downscaling (DCT scaling) before resampling
+            img.draft(img.mode, target_size)
+            img.thumbnail(target_size, Image.Resampling.LANCZOS)
+            
+            resized = io.BytesIO()
+            if img_format == "JPEG":
+                img.save(resized, "JPEG", quality=85, optimize=True)
+            else:
+                img.save(resized, "PNG", optimize=True)
+        resized.seek(0)
+        return resized
+    except Exception as e:
+        print(f"   ⚠️  Failed to resize image, using original: {e}")
+        image_buffer.seek(0)
+        return image_buffer
+
+async def _fetch_image_to_buffer(session: aiohttp.ClientSession, image_url: str) -> Optional[io.BytesIO]:
+    """Downloads a single image with a shared session into an in-memory buffer."""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(image_url, headers=headers, timeout=10, stream=True)
-        response.raise_for_status()
-        
-        file_path = os.path.join(TEMP_IMAGE_DIR, filename)
-        with open(file_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        # Validate it's a valid image
-        img = Image.open(file_path)
-        img.verify()
-        return file_path
+        async with session.get(image_url) as response:
+            response.raise_for_status()
+            image_buffer = io.BytesIO(await response.read())
+        
+        # Validate from the header only (no full decode); python-pptx can't embed other formats
+        with Image.open(image_buffer) as img:
+            if img.format not in SLIDE_IMAGE_FORMATS:
+                print(f"   ⚠️  Unsupported image format {img.format} for {image_url}")
+                return None
+            needs_resize = img.width > SLIDE_IMAGE_MAX_WIDTH
+        image_buffer.seek(0)
+        
+        # Decode/resample off the event loop so other downloads keep flowing
+        if needs_resize:
+            image_buffer = await asyncio.to_thread(_resize_for_slide, image_buffer)
+        return image_buffer
     except Exception as e:
         print(f"   ⚠️  Failed to download image {image_url}: {e}")
         return None
 
+async def download_images_to_buffers(image_urls: List[str]) -> List[Optional[io.BytesIO]]:
+    """
+    Downloads several images concurrently into in-memory buffers.
+    The buffers can be passed straight to slide.shapes.add_picture().
+    
+    Args:
+        image_urls: List of image URLs
+    
+    Returns:
+        List of BytesIO buffers (None for failed downloads), in input order
+    """
+    if not image_urls:
+        return []
+    
+    # One pooled session per batch: repeat hosts reuse the same keep-alive TLS connection,
+    # and each distinct URL is fetched only once
+    unique_urls = list(dict.fromkeys(image_urls))
+    connector = aiohttp.TCPConnector(limit=IMAGE_DOWNLOAD_CONNECTIONS, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=IMAGE_DOWNLOAD_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=IMAGE_REQUEST_HEADERS) as session:
+        buffers = await asyncio.gather(*[_fetch_image_to_buffer(session, url) for url in unique_urls])
+    by_url = dict(zip(unique_urls, buffers))
+    return [by_url[url] for url in image_urls]
+
+def download_image_to_buffer(image_url: str) -> Optional[io.BytesIO]:
+    """Downloads an image from URL into an in-memory buffer."""
+    return asyncio.run(download_images_to_buffers([image_url]))[0]
+
 # ============================================================
 # TEMPLATE REPLACEMENT FUNCTIONS (Using Placeholder Indices)
 # ============================================================
@@ -184,68 +299,122 @@ def detect_placeholder_info(slide, placeholder_idx):
     except (KeyError, AttributeError):
         return None
 
+def _append_text_paragraph(txBody, text, font_size, space_after):
+    """
+    Appends <a:p><a:r> for one line of text straight onto a txBody element.
+    Equivalent to add_paragraph() + p.text + run.font.size/name + p.space_after,
+    without creating the python-pptx proxy objects.
+    """
+    p = etree.SubElement(txBody, qn('a:p'))
+    if space_after:
+        spcAft = etree.SubElement(etree.SubElement(p, qn('a:pPr')), qn('a:spcAft'))
+        etree.SubElement(spcAft, qn('a:spcPts')).set('val', _PARAGRAPH_SPACING_CPTS)
+    r = etree.SubElement(p, qn('a:r'))
+    rPr = etree.SubElement(r, qn('a:rPr'))
+    rPr.set('sz', str(font_size * 100))
+    etree.SubElement(rPr, qn('a:latin')).set('typeface', _TEXT_FONT_NAME)
+    etree.SubElement(r, qn('a:t')).text = _CTRL_CHARS_RE.sub(lambda m: "_x%04X_" % ord(m.group()), text)
+
+def wrap_text(text, max_chars_per_line=80):
+    """
+    Greedy word wrap. Each word is measured once and every line is emitted as a
+    single slice of the original text, so no intermediate word lists are joined.
+    """
+    if len(text) <= max_chars_per_line:
+        return [text]
+    
+    lines = []
+    line_start = line_end = None
+    running_len = 0
+    for match in _WORD_RE.finditer(text):
+        start, end = match.span()
+        word_len = end - start
+        if line_start is None:
+            line_start, running_len = start, word_len + 1
+        elif running_len + word_len + 1 > max_chars_per_line:
+            lines.append(text[line_start:line_end])
+            line_start, running_len = start, word_len
+        else:
+            running_len += word_len + 1
+        line_end = end
+    
+    if line_start is not None:
+        lines.append(text[line_start:line_end])
+    return lines
+
+def _fits(text_length, font_size, placeholder_width, placeholder_height):
+    """Estimates whether text_length characters of Arial at font_size fit in the placeholder."""
+    usable_width = (placeholder_width - 2 * _TEXT_MARGIN_X) / EMU_PER_PT
+    usable_height = (placeholder_height - 2 * _TEXT_MARGIN_Y) / EMU_PER_PT
+    chars_per_line = int(usable_width / (font_size * ARIAL_AVG_CHAR_EM))
+    if chars_per_line <= 0:
+        return False
+    lines_needed = -(-text_length // chars_per_line)  # ceil
+    # Keep 20% headroom for paragraph spacing and uneven line breaks
+    return lines_needed * font_size * LINE_HEIGHT_FACTOR <= usable_height * 0.8
+
 def calculate_optimal_font_size(text_length, placeholder_width, placeholder_height, min_size=8, max_size=18):
     """
     Calculates optimal font size based on text length and placeholder dimensions.
     Prevents text overflow by reducing font size if needed.
+    Binary search over [min_size, max_size] for the largest size that fits (~4 probes).
     """
-    # Estimate characters per line based on placeholder width
-    # Rough estimate: 1 inch ≈ 12 characters at 12pt font
-    chars_per_line = int((placeholder_width / Inches(1)) * 12)
-    lines_available = int((placeholder_height / Inches(1)) * 2)  # Rough estimate
-    
-    if chars_per_line == 0 or lines_available == 0:
+    if not placeholder_width or not placeholder_height:
         return 12  # Default size
     
-    # Calculate how many lines the text will need
-    estimated_lines = max(1, text_length / chars_per_line)
-    
-    # If text fits comfortably, use max size
-    if estimated_lines <= lines_available * 0.8:
-        return max_size
-    
-    # If text is too long, reduce font size proportionally
-    ratio = (lines_available * 0.8) / estimated_lines
-    calculated_size = int(max_size * ratio)
-    
-    # Clamp between min and max
-    return max(min_size, min(calculated_size, max_size))
+    lo, hi = min_size, max_size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _fits(text_length, mid, placeholder_width, placeholder_height):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
-def fill_text_placeholder(slide, placeholder_idx, text_content):
+def fill_text_placeholder(slide, placeholder_idx, text_content, placeholder=None, precomputed_dims=None):
     """
     Helper to fill a text placeholder with formatted text.
     Detects placeholder format and adjusts font size to prevent overflow.
+    Pass placeholder when the caller has already looked it up (e.g. from a per-slide idx map),
+    and precomputed_dims=(width, height) to skip reading the geometry from the XML.
+    Empty content is written as "N/A": an empty placeholder would show the layout's prompt text.
+    
+    Returns:
+        True if the placeholder was filled (including the "N/A" fallback),
+        False if the placeholder is missing, not a text placeholder, or filling failed
     """
+    if not (text_content and text_content.strip()):
+        text_content = _EMPTY_TEXT_FILL
+    
     try:
-        # Detect placeholder info (like index.py)
-        placeholder_info = detect_placeholder_info(slide, placeholder_idx)
-        if not placeholder_info:
-            return False
+        if placeholder is None:
+            placeholder = slide.placeholders[placeholder_idx]
         
-        placeholder = placeholder_info['placeholder']
-        placeholder_type = placeholder_info['type']
-        placeholder_name = placeholder_info['name']
+        placeholder_type = placeholder.placeholder_format.type
+        placeholder_name = placeholder.name
         
         # Only fill BODY (2) or OBJECT (7) placeholders
         if placeholder_type not in [2, 7]:
-            print(f"   ⚠️  Placeholder {placeholder_idx} is type {placeholder_type}, not a text placeholder")
+            log.warning("   ⚠️  Placeholder %s is type %s, not a text placeholder", placeholder_idx, placeholder_type)
             return False
         
         if not hasattr(placeholder, 'text_frame'):
             return False
         
         tf = placeholder.text_frame
-        tf.clear()
         tf.word_wrap = True  # Enable word wrapping
         # Set margins to ensure text fits
-        tf.margin_left = Inches(0.1)
-        tf.margin_right = Inches(0.1)
-        tf.margin_top = Inches(0.05)
-        tf.margin_bottom = Inches(0.05)
+        tf.margin_left = _TEXT_MARGIN_X
+        tf.margin_right = _TEXT_MARGIN_X
+        tf.margin_top = _TEXT_MARGIN_Y
+        tf.margin_bottom = _TEXT_MARGIN_Y
         
         # Get placeholder dimensions for font size calculation
-        placeholder_width = placeholder.width
-        placeholder_height = placeholder.height
+        if precomputed_dims:
+            placeholder_width, placeholder_height = precomputed_dims
+        else:
+            placeholder_width = placeholder.width
+            placeholder_height = placeholder.height
         
         # Calculate optimal font size based on content length
         text_length = len(text_content)
@@ -265,90 +434,67 @@ def fill_text_placeholder(slide, placeholder_idx, text_content):
             lines = [text_content]
             if len(text_content) > 200:
                 # Split long text into chunks
-                words = text_content.split()
-                lines = []
-                current_line = []
-                current_length = 0
-                max_chars_per_line = 80
-                
-                for word in words:
-                    if current_length + len(word) + 1 > max_chars_per_line and current_line:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_length = len(word)
-                    else:
-                        current_line.append(word)
-                        current_length += len(word) + 1
-                
-                if current_line:
-                    lines.append(' '.join(current_line))
-        
-        # Add paragraphs for each line
-        for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-                
-            if i == 0:
-                # Use first paragraph
-                p = tf.paragraphs[0] if tf.paragraphs else tf.add_paragraph()
-            else:
-                p = tf.add_paragraph()
-            
-            # Set text (this creates a run automatically)
-            p.text = line.strip()
-            
-            # Set font properties on the first run
-            if p.runs:
-                run = p.runs[0]
-                run.font.size = Pt(optimal_font_size)
-                run.font.name = 'Arial'
-            
-            # Add spacing between paragraphs
-            if i < len(lines) - 1:
-                p.space_after = Pt(4)
+                lines = wrap_text(text_content, max_chars_per_line=80)
         
-        print(f"      📝 Filled placeholder {placeholder_idx} ({placeholder_name}, type {placeholder_type}) with font size {optimal_font_size}pt")
+        # Replace the existing paragraphs with one <a:p> per line, built directly in the XML
+        txBody = tf._txBody
+        for old_p in txBody.findall(qn('a:p')):
+            txBody.remove(old_p)
+        last_line = len(lines) - 1
+        for i, line in enumerate(lines):
+            line = line.strip()
+            if line:
+                # Add spacing between paragraphs
+                _append_text_paragraph(txBody, line, optimal_font_size, space_after=i < last_line)
+        if txBody.find(qn('a:p')) is None:
+            # A text body must keep at least one paragraph
+            etree.SubElement(txBody, qn('a:p'))
+        
+        log.debug("      📝 Filled placeholder %s (%s, type %s) with font size %spt",
+                  placeholder_idx, placeholder_name, placeholder_type, optimal_font_size)
         return True
         
     except (KeyError, AttributeError) as e:
         # Placeholder doesn't exist or doesn't have text_frame
         return False
     except Exception as e:
-        print(f"   ⚠️  Failed to fill text placeholder {placeholder_idx}: {e}")
+        log.warning("   ⚠️  Failed to fill text placeholder %s: %s", placeholder_idx, e)
         return False
 
-def fill_image_placeholder(slide, placeholder_idx, image_path):
-    """Helper to fill a picture placeholder with an image."""
+def fill_image_placeholder(slide, placeholder_idx, image, verified=False):
+    """
+    Helper to fill a picture placeholder with an image (file path or in-memory buffer).
+    Pass verified=True when the caller already knows the image exists (skips the stat call).
+    """
     try:
-        placeholder = slide.placeholders[placeholder_idx]
-        placeholder_type = placeholder.placeholder_format.type
+        ph = slide.placeholders[placeholder_idx]
+        fmt = ph.placeholder_format
         
-        if placeholder_type == 18:  # PICTURE (18)
-            if os.path.exists(image_path):
-                # Get placeholder position and size
-                left = placeholder.left
-                top = placeholder.top
-                width = placeholder.width
-                height = placeholder.height
-                
-                # Add picture at the same position (this will overlay/replace the placeholder)
-                slide.shapes.add_picture(image_path, left, top, width, height)
+        if fmt.type == 18:  # PICTURE (18)
+            if verified or not isinstance(image, str) or os.path.exists(image):
+                # Add picture at the placeholder's position and size (this will overlay/replace the placeholder)
+                slide.shapes.add_picture(image, ph.left, ph.top, ph.width, ph.height)
                 return True
         return False
     except (KeyError, AttributeError):
         # Placeholder doesn't exist
         return False
     except Exception as e:
-        print(f"   ⚠️  Failed to fill image placeholder {placeholder_idx}: {e}")
+        log.warning("   ⚠️  Failed to fill image placeholder %s: %s", placeholder_idx, e)
         return False
 
 # ============================================================
 # IMAGE INSERTION FUNCTIONS
 # ============================================================
 
+def _pick_image_url(item):
+    """Returns a partner's image URL (its plain 'url' is the source article, not an image)."""
+    return item.get('image_url') or item.get('image')
+
 def insert_customer_images_by_placeholder(slide, partners_data, placeholder_indices=[11, 12, 13]):
     """
     Inserts customer/partner images into picture placeholders (indices 11, 12, 13).
+    Only a partner's own image_url/image is used; placeholders without one stay empty.
     """
     if not partners_data:
         return
@@ -360,34 +506,33 @@ def insert_customer_images_by_placeholder(slide, partners_data, placeholder_indi
     elif isinstance(partners_data, dict) and 'partners' in partners_data:
         partners = partners_data['partners']
     
-    # Also try to use general images if no specific partner data
-    if not partners:
-        web_data = getattr(slide, '_web_data', {})
-        general_images = web_data.get('images', [])
-        if general_images:
-            for img in general_images[:3]:
-                partners.append({
-                    'title': img.get('title', 'Customer'),
-                    'image_url': img.get('url') or img.get('download_url')
-                })
+    image_urls = [url for url in map(_pick_image_url, partners) if url and url.startswith('http')]
     
+    # Generic stock photos are not customer logos, so without partner images the slots stay empty
+    if not image_urls:
+        print(f"   ℹ️  No partner images found - leaving customer placeholders empty")
+        return
+    
+    slots = list(zip(placeholder_indices, image_urls))
+    
+    downloads = [url for _, url in slots]
+    try:
+        downloaded = dict(zip(downloads, asyncio.run(download_images_to_buffers(downloads))))
+    except Exception as e:
+        print(f"   ⚠️  Failed to download customer images: {e}")
+        downloaded = {}
+    
+    # python-pptx is not thread-safe, so insertion stays sequential
     images_inserted = 0
-    for i, placeholder_idx in enumerate(placeholder_indices):
-        if i >= len(partners):
-            break
-        
-        partner = partners[i]
-        image_url = partner.get('image_url') or partner.get('image') or partner.get('url')
-        
-        if image_url and image_url.startswith('http'):
-            try:
-                img_path = download_image_to_temp(image_url, f"customer_{i}.jpg")
-                if img_path and os.path.exists(img_path):
-                    if fill_image_placeholder(slide, placeholder_idx, img_path):
-                        images_inserted += 1
-                        continue
-            except Exception as e:
-                print(f"   ⚠️  Failed to download/insert customer image {i+1}: {e}")
+    for placeholder_idx, image_url in slots:
+        image_buffer = downloaded.get(image_url)
+        try:
+            if image_buffer:
+                if fill_image_placeholder(slide, placeholder_idx, image_buffer, verified=True):
+                    images_inserted += 1
+                    continue
+        except Exception as e:
+            print(f"   ⚠️  Failed to insert customer image into placeholder {placeholder_idx}: {e}")
         
         # If image insertion failed, leave placeholder empty or add text
         print(f"   ⚠️  No image available for customer placeholder {placeholder_idx}")
@@ -399,50 +544,119 @@ def insert_customer_images_by_placeholder(slide, partners_data, placeholder_indi
 # MAIN GENERATION FUNCTION
 # ============================================================
 
-def create_presentation(structured_data, output_path):
+def _template_key(template_path):
+    """Cache key for a template file: editing the file on disk (new mtime) gives a new key."""
+    return (os.path.abspath(template_path), os.path.getmtime(template_path))
+
+def _get_template_bytes(template_path=TEMPLATE_PATH):
+    """Reads a template from disk on first use and keeps the bytes in memory."""
+    key = _template_key(template_path)
+    
+    with _TEMPLATE_LOCK:
+        template_bytes = _TEMPLATE_BYTES.get(key)
+        if template_bytes is None:
+            with open(template_path, 'rb') as f:
+                template_bytes = _TEMPLATE_BYTES[key] = f.read()
+    return template_bytes
+
+def load_template(template_path=None):
     """
-    Main function to generate presentation from template.
-    Falls back to programmatic generation if template not found.
+    Loads the PPT template.
+    Each template file is read from disk once; every call parses a fresh Presentation from the in-memory copy.
+    Returns the Presentation object, or None if the template is missing or unreadable.
     """
-    print(f"🎨 Generating Presentation for {structured_data.get('company_codename')}...")
-    
-    # Try template-based approach first
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "template.pptx")
-    if os.path.exists(template_path):
-        print("📄 Using template-based generation...")
-        success = create_presentation_from_template(structured_data, output_path, template_path)
-        if success:
-            return
-        else:
-            print("⚠️  Template generation failed, falling back to programmatic generation...")
-    
-    # Fallback: Programmatic generation
-    print("📝 Using programmatic generation...")
-    create_presentation_programmatic(structured_data, output_path)
-
-def create_presentation_from_template(structured_data, output_path, template_path=None):
-    """Generates presentation from template by replacing placeholders."""
-    global TEMP_IMAGE_DIR
-    
     if template_path is None:
         template_path = TEMPLATE_PATH
     
     if not os.path.exists(template_path):
         print(f"❌ Template not found: {template_path}")
-        return False
+        return None
     
     print(f"📄 Loading template from: {template_path}")
     
     try:
-        prs = Presentation(template_path)
+        prs = Presentation(io.BytesIO(_get_template_bytes(template_path)))
+        # Placeholder sizes are fixed by the template, so measure them once per template file
+        key = _template_key(template_path)
+        if key not in _SLIDE_GEOMETRY:
+            _SLIDE_GEOMETRY[key] = {
+                (slide_idx, ph.placeholder_format.idx): (ph.width, ph.height)
+                for slide_idx, slide in enumerate(prs.slides)
+                for ph in slide.placeholders
+            }
+        # Picked up by create_presentation_from_template
+        prs._slide_geometry = _SLIDE_GEOMETRY[key]
         print(f"   ✅ Template loaded. Found {len(prs.slides)} slides.")
+        return prs
     except Exception as e:
         print(f"❌ Failed to load template: {e}")
-        return False
+        return None
+
+def create_presentation_with_status(structured_data, output_path, prs=None):
+    """
+    Same as create_presentation(), but returns (saved_path, used_template) so callers
+    can tell a template-based deck from the programmatic fallback.
+    """
+    print(f"🎨 Generating Presentation for {structured_data.get('company_codename')}...")
+    
+    # Try template-based approach first
+    template_path = TEMPLATE_PATH
+    if prs is not None or os.path.exists(template_path):
+        print("📄 Using template-based generation...")
+        saved_path = create_presentation_from_template(structured_data, output_path, template_path, prs=prs)
+        if saved_path:
+            return saved_path, True
+        else:
+            print("⚠️  Template generation failed, falling back to programmatic generation...")
+    
+    # Fallback: Programmatic generation
+    print("📝 Using programmatic generation...")
+    return create_presentation_programmatic(structured_data, output_path), False
+
+def create_presentation(structured_data, output_path, prs=None):
+    """
+    Main function to generate presentation from template.
+    Falls back to programmatic generation if template not found.
+    A template already loaded with load_template() can be passed in as `prs`.
+    Returns the path the presentation was saved to.
+    """
+    return create_presentation_with_status(structured_data, output_path, prs)[0]
+
+def _fill_slide_text(slide, slide_num, placeholders, geometry, placeholder_idx, label, text_content):
+    """
+    Fills one text placeholder of a template slide (slide_num is 1-based) and logs the outcome.
+    Only a missing/failed placeholder is a warning; a field without data is expected.
+    Returns True if real content was written.
+    """
+    has_content = bool(text_content and text_content.strip())
+    filled = fill_text_placeholder(slide, placeholder_idx, text_content,
+                                   placeholder=placeholders.get(placeholder_idx),
+                                   precomputed_dims=geometry.get((slide_num - 1, placeholder_idx)))
+    if not filled:
+        log.warning("      ⚠️  Placeholder %s (%s) not filled in Slide %s", placeholder_idx, label, slide_num)
+    elif has_content:
+        log.debug("      ✅ Filled placeholder %s: %s", placeholder_idx, label)
+    else:
+        log.debug("      ⏭️  No data for placeholder %s (%s) - wrote N/A", placeholder_idx, label)
+    return filled and has_content
+
+def create_presentation_from_template(structured_data, output_path, template_path=None, prs=None):
+    """
+    Generates presentation from template by replacing placeholders.
+    Returns the saved file path, or None on failure.
+    """
+    if prs is None:
+        prs = load_template(template_path)
+        if prs is None:
+            return None
     
     # ============================================================
     # PREPARE DATA DICTIONARY (Match template markers exactly)
     # ============================================================
+    # Template placeholder sizes measured by load_template()
+    geometry = getattr(prs, '_slide_geometry', {})
+    
+    fin = structured_data.get('financials', {})
     data_dict = {
         # Slide 1: Business Overview
         "Business_Overview": format_list(structured_data.get('business_overview', []), max_items=4),
@@ -454,10 +668,10 @@ def create_presentation_from_template(structured_data, output_path, template_pat
         ),
         
         # Slide 2: Financial Metrics
-        "EBITDA": clean_text(structured_data.get('financials', {}).get('ebitda', 'N/A')),
-        "ROCE": clean_text(structured_data.get('financials', {}).get('roce', 'N/A')),
-        "ROE": clean_text(structured_data.get('financials', {}).get('roe', 'N/A')),
-        "DEBT": clean_text(structured_data.get('financials', {}).get('debt', 'N/A')),
+        "EBITDA": clean_text(fin.get('ebitda', 'N/A')),
+        "ROCE": clean_text(fin.get('roce', 'N/A')),
+        "ROE": clean_text(fin.get('roe', 'N/A')),
+        "DEBT": clean_text(fin.get('debt', 'N/A')),
         "Assumptions": clean_text(structured_data.get('assumptions', 'N/A')),
         "metrics_point": clean_text(structured_data.get('metrics_point', 'N/A')),
         "Upcoming_Facility": clean_text(structured_data.get('upcoming_facility', 'N/A')),
@@ -469,8 +683,7 @@ def create_presentation_from_template(structured_data, output_path, template_pat
     }
     
     # Add any additional financial metrics
-    financials = structured_data.get('financials', {})
-    for key, value in financials.items():
+    for key, value in fin.items():
         marker = key.upper()
         if marker not in data_dict:
             data_dict[marker] = clean_text(value)
@@ -478,130 +691,90 @@ def create_presentation_from_template(structured_data, output_path, template_pat
     # ============================================================
     # FILL PLACEHOLDERS BY INDEX IN ALL SLIDES
     # ============================================================
-    print("🔄 Filling placeholders by index...")
+    log.debug("🔄 Filling placeholders by index...")
     total_replacements = 0
     
     # Debug: List available placeholders for each slide (like index.py)
-    for slide_num, slide in enumerate(prs.slides, 1):
-        available_placeholders = []
-        placeholder_details = []
-        # Try to find placeholders by attempting to access common indices
-        for idx in range(0, 20):
-            try:
-                placeholder = slide.placeholders[idx]
-                placeholder_info = detect_placeholder_info(slide, idx)
-                if placeholder_info:
-                    available_placeholders.append(idx)
-                    placeholder_details.append(
-                        f"idx={placeholder_info['idx']}, type={placeholder_info['type']}, name='{placeholder_info['name']}'"
-                    )
-            except (KeyError, AttributeError):
-                pass
-        if available_placeholders:
-            print(f"   📋 Slide {slide_num} has placeholders: {sorted(available_placeholders)}")
-            for detail in placeholder_details:
-                print(f"      - {detail}")
+    if DEBUG:
+        for slide_num, slide in enumerate(prs.slides, 1):
+            available_placeholders = []
+            placeholder_details = []
+            for placeholder in slide.placeholders:
+                fmt = placeholder.placeholder_format
+                available_placeholders.append(fmt.idx)
+                placeholder_details.append(f"idx={fmt.idx}, type={fmt.type}, name='{placeholder.name}'")
+            if available_placeholders:
+                log.debug("   📋 Slide %s has placeholders: %s", slide_num, sorted(available_placeholders))
+                for detail in placeholder_details:
+                    log.debug("      - %s", detail)
     
     # Skip Slide 1 (index 0) - it's introductory
-    print("   📄 Slide 1: Skipping (introductory slide)")
+    log.debug("   📄 Slide 1: Skipping (introductory slide)")
     
     # Slide 2 (index 1): Business Overview
     if len(prs.slides) >= 2:
         slide2 = prs.slides[1]  # Second slide (index 1)
-        print("   📄 Slide 2: Business Overview")
+        placeholders2 = {p.placeholder_format.idx: p for p in slide2.placeholders}
+        log.debug("   📄 Slide 2: Business Overview")
         
         # Based on detected placeholders: [10, 11, 12, 13, 14, 15, 16]
         # Index 10: Business Overview text (BODY)
-        if fill_text_placeholder(slide2, 10, data_dict.get("Business_Overview", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 10: Business Overview")
-        else:
-            print("      ⚠️  Placeholder 10 not found in Slide 2")
+        total_replacements += _fill_slide_text(slide2, 2, placeholders2, geometry, 10, "Business Overview", data_dict.get("Business_Overview", ""))
         
         # Index 14: Product Portfolio (OBJECT)
-        if fill_text_placeholder(slide2, 14, data_dict.get("Project_Portfolio", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 14: Product Portfolio")
-        else:
-            print("      ⚠️  Placeholder 14 not found in Slide 2")
+        total_replacements += _fill_slide_text(slide2, 2, placeholders2, geometry, 14, "Product Portfolio", data_dict.get("Project_Portfolio", ""))
         
         # Index 15: Applications (OBJECT)
-        if fill_text_placeholder(slide2, 15, data_dict.get("Applications", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 15: Applications")
-        else:
-            print("      ⚠️  Placeholder 15 not found in Slide 2")
+        total_replacements += _fill_slide_text(slide2, 2, placeholders2, geometry, 15, "Applications", data_dict.get("Applications", ""))
         
         # Index 16: Certifications (OBJECT)
-        if fill_text_placeholder(slide2, 16, data_dict.get("Certifications", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 16: Certifications")
-        else:
-            print("      ⚠️  Placeholder 16 not found in Slide 2")
+        total_replacements += _fill_slide_text(slide2, 2, placeholders2, geometry, 16, "Certifications", data_dict.get("Certifications", ""))
         
         # Index 11, 12, 13 are PICTURE placeholders - handled separately for customer images
     
     # Slide 3 (index 2): Financial Metrics
     if len(prs.slides) >= 3:
         slide3 = prs.slides[2]  # Third slide (index 2)
-        print("   📄 Slide 3: Financial Metrics")
+        placeholders3 = {p.placeholder_format.idx: p for p in slide3.placeholders}
+        log.debug("   📄 Slide 3: Financial Metrics")
         
         # Based on detected placeholders: [10, 11, 12, 13, 14, 15]
         # Index 11: Assumptions (BODY)
-        if fill_text_placeholder(slide3, 11, data_dict.get("Assumptions", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 11: Assumptions")
-        else:
-            print("      ⚠️  Placeholder 11 not found in Slide 3")
+        total_replacements += _fill_slide_text(slide3, 3, placeholders3, geometry, 11, "Assumptions", data_dict.get("Assumptions", ""))
         
         # Index 14: Metrics point (BODY)
-        if fill_text_placeholder(slide3, 14, data_dict.get("metrics_point", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 14: Metrics Point")
-        else:
-            print("      ⚠️  Placeholder 14 not found in Slide 3")
+        total_replacements += _fill_slide_text(slide3, 3, placeholders3, geometry, 14, "Metrics Point", data_dict.get("metrics_point", ""))
         
         # Index 15: Upcoming Facility (BODY)
-        if fill_text_placeholder(slide3, 15, data_dict.get("Upcoming_Facility", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 15: Upcoming Facility")
-        else:
-            print("      ⚠️  Placeholder 15 not found in Slide 3")
+        total_replacements += _fill_slide_text(slide3, 3, placeholders3, geometry, 15, "Upcoming Facility", data_dict.get("Upcoming_Facility", ""))
         
         # Note: Charts (10, 12, 13) would need chart data - skipping for now
-        print("      ⚠️  Chart placeholders (10, 12, 13) require chart data - skipping")
+        log.debug("      ⚠️  Chart placeholders (10, 12, 13) require chart data - skipping")
     
     # Slide 4 (index 3): Investment Highlights
     if len(prs.slides) >= 4:
         slide4 = prs.slides[3]  # Fourth slide (index 3)
-        print("   📄 Slide 4: Investment Highlights")
+        placeholders4 = {p.placeholder_format.idx: p for p in slide4.placeholders}
+        log.debug("   📄 Slide 4: Investment Highlights")
         
         # Based on detected placeholders: [10]
         # Index 10: Investment Highlights (BODY)
-        if fill_text_placeholder(slide4, 10, data_dict.get("Investment_Highlights", "")):
-            total_replacements += 1
-            print("      ✅ Filled placeholder 10: Investment Highlights")
-        else:
-            print("      ⚠️  Placeholder 10 not found in Slide 4")
+        total_replacements += _fill_slide_text(slide4, 4, placeholders4, geometry, 10, "Investment Highlights", data_dict.get("Investment_Highlights", ""))
     
-    print(f"   ✅ Total replacements: {total_replacements}")
+    log.debug("   ✅ Total replacements: %s", total_replacements)
     
     # ============================================================
     # INSERT IMAGES FROM WEB SEARCH
     # ============================================================
     web_data = structured_data.get('web_data', {})
     
-    # Store web_data in slide for image insertion functions
-    if len(prs.slides) >= 2:
-        prs.slides[1]._web_data = web_data
-    
     # Insert key customer/partner images into Slide 2 (Business Overview) placeholders (11, 12, 13)
     if len(prs.slides) >= 2:
         slide2 = prs.slides[1]  # Second slide (Business Overview)
         business_info = web_data.get('business_info', {})
         partners = business_info.get('partners', [])
         
-        print(f"🖼️  Inserting customer/partner images into Slide 2 placeholders 11, 12, 13...")
+        log.debug("🖼️  Inserting customer/partner images into Slide 2 placeholders 11, 12, 13...")
         insert_customer_images_by_placeholder(slide2, partners, placeholder_indices=[11, 12, 13])
     
     # ============================================================
@@ -612,21 +785,13 @@ def create_presentation_from_template(structured_data, output_path, template_pat
         unique_output_path = get_unique_output_path(output_path)
         prs.save(unique_output_path)
         print(f"✅ Presentation saved to: {unique_output_path}")
-        
-        # Clean up temporary images
-        if TEMP_IMAGE_DIR and os.path.exists(TEMP_IMAGE_DIR):
-            try:
-                shutil.rmtree(TEMP_IMAGE_DIR)
-            except:
-                pass
-        
-        return True
+        return unique_output_path
     except Exception as e:
-        print(f"❌ Failed to save presentation: {e}")
-        return False
+        log.error("❌ Failed to save presentation: %s", e)
+        return None
 
 def create_presentation_programmatic(structured_data, output_path):
-    """Fallback: Creates presentation programmatically if template not available."""
+    """Fallback: Creates presentation programmatically if template not available. Returns the saved path."""
     prs = Presentation()
     prs.slide_width = Inches(13.33)
     prs.slide_height = Inches(7.5)
@@ -676,3 +841,4 @@ def create_presentation_programmatic(structured_data, output_path):
     unique_output_path = get_unique_output_path(output_path)
     prs.save(unique_output_path)
     print(f"✅ Success! Presentation saved to: {unique_output_path}")
+    return unique_output_path
@@ -1,60 +1,137 @@
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import pdfplumber
 
+# Optional: python-calamine (Rust xlsx/xls reader) streams sheet rows without building DataFrames
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# PDF/Excel parsing is CPU-bound pure Python, so files are read in worker processes
+MAX_INGEST_WORKERS = 8
+# Worker start-up is only worth paying for this much PDF/Excel input
+PROCESS_POOL_MIN_BYTES = 5 * 1024 * 1024
+_POOLED_EXTENSIONS = ('.pdf', '.xlsx', '.xls')
+
+# Text clustering tolerances (in points) for pdfplumber's extract_text()
+PDF_X_TOLERANCE = 2
+PDF_Y_TOLERANCE = 3
+
+def _release_page(page):
+    """Drops pdfplumber's per-page object caches so memory stays flat on long PDFs."""
+    page.flush_cache()
+    textmap_cache = getattr(page, 'get_textmap', None)
+    if hasattr(textmap_cache, 'cache_clear'):
+        textmap_cache.cache_clear()
+
+def _cell_text(value):
+    """Formats a calamine cell for the LLM (calamine returns whole numbers as floats, e.g. years)."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _read_excel_sheets(file_path):
+    """
+    Yields (sheet_name, table_text) for every sheet in a workbook.
+    Uses python-calamine (tab-separated rows) when installed, pandas otherwise.
+    """
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(file_path)
+        for sheet_name in workbook.sheet_names:
+            rows = workbook.get_sheet_by_name(sheet_name).to_python()
+            yield sheet_name, '\n'.join('\t'.join(_cell_text(c) for c in row) for row in rows)
+        return
+
+    xls = pd.ExcelFile(file_path)
+    for sheet_name in xls.sheet_names:
+        df = pd.read_excel(xls, sheet_name=sheet_name)
+        # Convert Table to tab-separated text so LLM can read it (to_string's column padding isn't needed)
+        header = '\t'.join(map(str, df.columns))
+        body = '\n'.join('\t'.join(row) for row in df.fillna('').astype(str).to_numpy())
+        yield sheet_name, f"{header}\n{body}"
+
+def _read_one(file_path):
+    """
+    Reads a single PDF, Excel, or Text file.
+    Top-level so it can be pickled into ProcessPoolExecutor workers.
+
+    Returns:
+        (filename, text) - text is "" for unsupported files or read errors
+    """
+    filename = os.path.basename(file_path)
+    parts = []
+
+    try:
+        # --- HANDLE TEXT / README FILES (Your current case) ---
+        if filename.lower().endswith(('.txt', '.md')):
+            print(f"   -> Reading Text: {filename}")
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+                parts.append(f"\n\n--- FILE: {filename} ---\n{content}")
+
+        # --- HANDLE PDF FILES (Mandatory Requirement) ---
+        elif filename.lower().endswith('.pdf'):
+            print(f"   -> Reading PDF: {filename}")
+            with pdfplumber.open(file_path) as pdf:
+                page_parts = []
+                for page in pdf.pages:
+                    # Scanned/image-only page: no text layer, nothing to extract
+                    if page.chars:
+                        page_text = page.extract_text(x_tolerance=PDF_X_TOLERANCE, y_tolerance=PDF_Y_TOLERANCE)
+                        if page_text:
+                            page_parts.append(page_text + "\n")
+                    _release_page(page)
+                text = ''.join(page_parts)
+                parts.append(f"\n\n--- FILE: {filename} (PDF Content) ---\n{text}")
+
+        # --- HANDLE EXCEL FILES (Mandatory Requirement) ---
+        elif filename.lower().endswith(('.xlsx', '.xls')):
+            print(f"   -> Reading Excel: {filename}")
+            for sheet_name, table_text in _read_excel_sheets(file_path):
+                parts.append(f"\n\n--- FILE: {filename} | SHEET: {sheet_name} ---\n{table_text}")
+
+    except Exception as e:
+        print(f"   ⚠️ Error reading {filename}: {e}")
+
+    return filename, ''.join(parts)
+
 def ingest_company_data(folder_path):
     """
     Reads all PDF, Excel, and Text files in a folder and returns a single combined string.
+
+    Large PDF/Excel batches are parsed in spawned worker processes, which re-import the
+    calling script: scripts that call this must keep their entry point under an
+    `if __name__ == "__main__":` guard.
     """
-    combined_text = ""
-    
     # Check if folder exists
     if not os.path.exists(folder_path):
         return f"Error: Folder not found at {folder_path}"
 
     print(f"📂 Scanning folder: {folder_path}...")
 
-    files = os.listdir(folder_path)
-    if not files:
+    # SKIP SYSTEM FILES (like .DS_Store on Mac) and sub-folders; DirEntry carries the file type, so no extra stat
+    with os.scandir(folder_path) as it:
+        file_list = [entry.path for entry in it if entry.is_file() and not entry.name.startswith('.')]
+    if not file_list:
         return "Warning: No files found in this folder."
 
-    for filename in files:
-        file_path = os.path.join(folder_path, filename)
-        
-        # SKIP SYSTEM FILES (like .DS_Store on Mac)
-        if filename.startswith('.'):
-            continue
-
-        try:
-            # --- HANDLE TEXT / README FILES (Your current case) ---
-            if filename.lower().endswith(('.txt', '.md')):
-                print(f"   -> Reading Text: {filename}")
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    combined_text += f"\n\n--- FILE: {filename} ---\n{content}"
-
-            # --- HANDLE PDF FILES (Mandatory Requirement) ---
-            elif filename.lower().endswith('.pdf'):
-                print(f"   -> Reading PDF: {filename}")
-                with pdfplumber.open(file_path) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                    combined_text += f"\n\n--- FILE: {filename} (PDF Content) ---\n{text}"
-
-            # --- HANDLE EXCEL FILES (Mandatory Requirement) ---
-            elif filename.lower().endswith(('.xlsx', '.xls')):
-                print(f"   -> Reading Excel: {filename}")
-                xls = pd.ExcelFile(file_path)
-                for sheet_name in xls.sheet_names:
-                    df = pd.read_excel(xls, sheet_name=sheet_name)
-                    # Convert Table to String so LLM can read it
-                    table_text = df.to_string(index=False)
-                    combined_text += f"\n\n--- FILE: {filename} | SHEET: {sheet_name} ---\n{table_text}"
-
-        except Exception as e:
-            print(f"   ⚠️ Error reading {filename}: {e}")
-
-    return combined_text
\ No newline at end of file
+    # Spawning workers re-imports __main__ in every child (~1-2s), so only PDF/Excel
+    # batches big enough to amortise that go to the pool; the rest read serially
+    heavy_files = [path for path in file_list if path.lower().endswith(_POOLED_EXTENSIONS)]
+    use_pool = (len(heavy_files) >= 2
+                and sum(os.path.getsize(path) for path in heavy_files) >= PROCESS_POOL_MIN_BYTES)
+
+    if not use_pool:
+        results = [_read_one(file_path) for file_path in file_list]
+    else:
+        # "spawn": the pipeline calls this from a worker thread, and fork() from a
+        # multi-threaded process can deadlock the children
+        with ProcessPoolExecutor(max_workers=min(MAX_INGEST_WORKERS, os.cpu_count() or 1),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            # map() keeps the original file order
+            results = list(executor.map(_read_one, file_list))
+
+    return ''.join(text for _, text in results)
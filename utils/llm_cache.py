@@ -0,0 +1,92 @@
+"""
+LLM Response Cache
+
+Keeps the cleaned JSON returned by Gemini in a small SQLite database so that
+re-running the pipeline on the same (or a re-extracted) company folder skips
+the LLM round trip entirely.
+
+Lookup Strategy:
+- Inputs are normalized (whitespace collapsed) before hashing, so the same
+  documents re-extracted with slightly different spacing still hit
+- Key = SHA-256 of the normalized input
+- Entries never expire unless the caller passes max_age_seconds
+- Set KELP_CACHE_DIR to move the cache, or KELP_LLM_CACHE_DISABLED=1 to bypass it
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+from typing import Optional
+
+CACHE_DIR = os.getenv("KELP_CACHE_DIR", os.path.join("data", ".cache"))
+CACHE_DB_PATH = os.path.join(CACHE_DIR, "llm_cache.sqlite3")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def cache_enabled() -> bool:
+    """Returns False when the cache has been switched off via the environment."""
+    return os.getenv("KELP_LLM_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+def normalize_text(text: str) -> str:
+    """Collapses runs of whitespace so cosmetic extraction differences share a key."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+def make_cache_key(text: str) -> str:
+    """Returns the SHA-256 hex digest of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB_PATH, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+    )
+    return conn
+
+def get_cached_response(key: str, max_age_seconds: Optional[float] = None) -> Optional[str]:
+    """
+    Looks up a cached LLM response.
+
+    Args:
+        key: Cache key from make_cache_key()
+        max_age_seconds: Treat entries older than this as a miss (None = no expiry)
+
+    Returns:
+        The stored response string, or None on a miss
+    """
+    if not cache_enabled():
+        return None
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        if max_age_seconds is not None and time.time() - row[1] > max_age_seconds:
+            return None
+        return row[0]
+    except sqlite3.Error as e:
+        print(f"   ⚠️  LLM cache read failed: {e}")
+        return None
+
+def store_response(key: str, value: str) -> None:
+    """Stores an LLM response under the given key (overwrites any previous entry)."""
+    if not cache_enabled():
+        return
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"   ⚠️  LLM cache write failed: {e}")
@@ -0,0 +1,147 @@
+"""
+Pipeline Output Cache
+
+Two levels of execution avoidance for re-runs of a company folder:
+
+1. Output cache: same input files AND same template -> the previously generated
+   .pptx is copied to the new output path; nothing else runs.
+   - Key = SHA-256 over PIPELINE_CACHE_VERSION, the sorted (filename, SHA-256(content)) pairs
+     and the template digest (bump the version when generation output changes)
+   - Cached decks live in KELP_PIPELINE_CACHE_DIR as <key>.pptx and expire after 7 days
+   - Only decks built from the template with successful web search results are stored
+2. Manifest: data/output/<company>_manifest.json records the input file hashes next to
+   the Gemini analysis and web data. Same input files (e.g. only the template changed)
+   -> Steps 1-3 are skipped and only the PPT is regenerated.
+   - Web data from a failed search (web_data['web_ok'] not set) is not recorded or reused,
+     and recorded web data expires with
+     the web cache (WEB_CACHE_TTL_SECONDS); either way Steps 1-3 run again (the analysis
+     itself then comes from the LLM cache)
+"""
+
+import os
+import time
+import shutil
+import hashlib
+from typing import Dict, Optional
+from utils import serde
+from utils.generator import get_unique_output_path, TEMPLATE_PATH
+from utils.web_cache import WEB_CACHE_TTL_SECONDS
+
+PIPELINE_CACHE_DIR = os.getenv("KELP_PIPELINE_CACHE_DIR", os.path.join("data", ".cache", "pipeline"))
+PIPELINE_CACHE_VERSION = 1
+PIPELINE_CACHE_TTL_SECONDS = 7 * 86400
+
+def hash_file(file_path: str) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def hash_input_files(input_dir: str) -> Dict[str, str]:
+    """
+    Fingerprints every input file in a company folder (system files like .DS_Store are skipped).
+
+    Args:
+        input_dir: Path to the company's input folder
+
+    Returns:
+        Dict mapping filename -> SHA-256 hex digest of its contents
+    """
+    file_hashes = {}
+    for filename in sorted(os.listdir(input_dir)):
+        file_path = os.path.join(input_dir, filename)
+        if filename.startswith('.') or not os.path.isfile(file_path):
+            continue
+        file_hashes[filename] = hash_file(file_path)
+    return file_hashes
+
+def make_pipeline_key(file_hashes: Dict[str, str], template_path: str = TEMPLATE_PATH) -> str:
+    """Combines the input file hashes and the template digest into one output-cache key."""
+    digest = hashlib.sha256(f"v{PIPELINE_CACHE_VERSION}\n".encode('utf-8'))
+    for filename in sorted(file_hashes):
+        digest.update(f"{filename}\0{file_hashes[filename]}\n".encode('utf-8'))
+    if os.path.exists(template_path):
+        digest.update(f"template\0{hash_file(template_path)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def _cached_pptx_path(key: str) -> str:
+    return os.path.join(PIPELINE_CACHE_DIR, f"{key}.pptx")
+
+def restore_cached_output(key: str, output_path: str) -> Optional[str]:
+    """
+    Copies a previously generated deck to output_path if one exists for the key
+    and is younger than PIPELINE_CACHE_TTL_SECONDS.
+    Like the generator, an existing file at output_path is never overwritten.
+
+    Returns:
+        The path written on a hit, None on a miss
+    """
+    cached_path = _cached_pptx_path(key)
+    try:
+        if time.time() - os.path.getmtime(cached_path) > PIPELINE_CACHE_TTL_SECONDS:
+            return None
+    except OSError:
+        return None
+    try:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        output_path = get_unique_output_path(output_path)
+        shutil.copyfile(cached_path, output_path)
+        return output_path
+    except OSError as e:
+        print(f"   ⚠️  Pipeline cache restore failed: {e}")
+        return None
+
+def store_output(key: str, pptx_path: str) -> None:
+    """Keeps a copy of a freshly generated deck for future runs with the same inputs."""
+    try:
+        os.makedirs(PIPELINE_CACHE_DIR, exist_ok=True)
+        shutil.copyfile(pptx_path, _cached_pptx_path(key))
+    except OSError as e:
+        print(f"   ⚠️  Pipeline cache write failed: {e}")
+
+def load_manifest(manifest_path: str) -> Optional[Dict]:
+    """Returns the saved manifest for a company, or None if missing/unreadable."""
+    try:
+        with open(manifest_path, 'rb') as f:
+            return serde.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️  Could not read manifest {manifest_path}: {e}")
+        return None
+
+def manifest_web_data(manifest: Dict) -> Optional[Dict]:
+    """Returns the manifest's web data, or None if it was not recorded, came from a failed search, or has expired."""
+    web_data = manifest.get('web_data')
+    if not web_data or not web_data.get('web_ok'):
+        return None
+    if time.time() - manifest.get('web_saved_at', 0) > WEB_CACHE_TTL_SECONDS:
+        return None
+    return web_data
+
+def save_manifest(manifest_path: str, file_hashes: Dict[str, str], structured_data: Dict, web_ok: bool = True) -> None:
+    """
+    Records the input file hashes together with the stage outputs they produced.
+
+    Args:
+        manifest_path: Where to write the manifest (next to the generated PPT)
+        file_hashes: Output of hash_input_files()
+        structured_data: Gemini analysis with the web search results under 'web_data'
+        web_ok: False if the web search failed; its result is then not recorded. Web data
+            without the web_ok flag set by get_web_data_for_company() is never recorded either
+    """
+    analysis = {k: v for k, v in structured_data.items() if k != 'web_data'}
+    web_data = structured_data.get('web_data') or {}
+    manifest = {
+        'files': file_hashes,
+        'structured_data': analysis,
+        'web_data': web_data if web_ok and web_data.get('web_ok') else None,
+        'web_saved_at': time.time()
+    }
+    try:
+        with open(manifest_path, 'wb') as f:
+            f.write(serde.dumps(manifest, indent=True))
+    except (OSError, TypeError) as e:
+        print(f"   ⚠️  Could not write manifest {manifest_path}: {e}")
@@ -0,0 +1,33 @@
+"""
+Serialization helpers shared by the caches, manifests and LLM output parsing.
+
+- JSON: orjson (C/SIMD implementation, returns bytes)
+- Binary blobs (web data cache): msgpack via ormsgpack
+"""
+
+import orjson
+import ormsgpack
+
+# Raised by loads() on malformed JSON (subclass of json.JSONDecodeError / ValueError)
+JSONDecodeError = orjson.JSONDecodeError
+
+def dumps(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serializes to UTF-8 JSON bytes. Unknown types are stringified."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=str, option=option)
+
+def loads(data):
+    """Parses JSON from str or bytes."""
+    return orjson.loads(data)
+
+def packb(obj) -> bytes:
+    """Serializes to msgpack bytes. Unknown types are stringified."""
+    return ormsgpack.packb(obj, default=str)
+
+def unpackb(data: bytes):
+    """Parses msgpack bytes."""
+    return ormsgpack.unpackb(data)
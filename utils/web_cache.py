@@ -0,0 +1,98 @@
+"""
+Web Search Disk Cache
+
+Memoizes get_web_data_for_company() on disk so repeat runs for the same company
+skip the Unsplash/Tavily/Gemini round trips (and don't burn Tavily quota).
+
+- Key = SHA-256 of "company_name|company_data"
+- Entries expire after 7 days (WEB_CACHE_TTL_SECONDS)
+- Stored as msgpack blobs (utils/serde.py), one file per key, in KELP_WEB_CACHE_DIR
+
+Raw Tavily/Unsplash responses are cached the same way, one level down, so identical
+queries (also across companies) skip the API call:
+- Key = SHA-256 of method + URL + request params (API keys excluded)
+- Entries expire after 1 day (HTTP_CACHE_TTL_SECONDS), stored in KELP_HTTP_CACHE_DIR
+"""
+
+import os
+import time
+import hashlib
+import functools
+from typing import Any, Callable, Dict, Optional
+from utils import serde
+
+WEB_CACHE_DIR = os.getenv("KELP_WEB_CACHE_DIR", os.path.join("data", ".cache", "web"))
+WEB_CACHE_TTL_SECONDS = 7 * 86400
+HTTP_CACHE_DIR = os.getenv("KELP_HTTP_CACHE_DIR", os.path.join("data", ".cache", "http"))
+HTTP_CACHE_TTL_SECONDS = 86400
+
+def make_web_cache_key(company_name: str, company_data: str) -> str:
+    """Returns the cache key for a company's web search results."""
+    return hashlib.sha256((company_name + "|" + company_data).encode("utf-8")).hexdigest()
+
+def _cache_path(key: str, cache_dir: str = WEB_CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f"{key}.msgpack")
+
+def _load(path: str, ttl_seconds: float) -> Optional[Any]:
+    try:
+        if time.time() - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, "rb") as f:
+            return serde.unpackb(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"   ⚠️  Web cache read failed: {e}")
+        return None
+
+def _save(path: str, data: Any) -> None:
+    # Atomic write, so concurrent readers never see partial files
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(serde.packb(data))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"   ⚠️  Web cache write failed: {e}")
+
+def load_web_data(key: str) -> Optional[Dict]:
+    """Returns cached web data for the key, or None if missing/expired/unreadable."""
+    return _load(_cache_path(key), WEB_CACHE_TTL_SECONDS)
+
+def save_web_data(key: str, web_data: Dict) -> None:
+    """Writes web data to the cache (atomically, so concurrent readers never see partial files)."""
+    _save(_cache_path(key), web_data)
+
+def make_http_cache_key(method: str, url: str, params: Dict) -> str:
+    """Returns the cache key for one API request (params must not include credentials)."""
+    return hashlib.sha256(method.encode("utf-8") + b" " + url.encode("utf-8") + b" " + serde.dumps(params, sort_keys=True)).hexdigest()
+
+def load_http_response(key: str) -> Optional[Any]:
+    """Returns a cached decoded API response, or None if missing/expired/unreadable."""
+    return _load(_cache_path(key, HTTP_CACHE_DIR), HTTP_CACHE_TTL_SECONDS)
+
+def save_http_response(key: str, data: Any) -> None:
+    """Caches a decoded API response (only successful responses should be stored)."""
+    _save(_cache_path(key, HTTP_CACHE_DIR), data)
+
+def cached_web_search(func: Callable[[str, str], Dict]) -> Callable[[str, str], Dict]:
+    """
+    Decorator for get_web_data_for_company(company_name, company_data).
+    Results are only cached when the network searches succeeded (web_data['web_ok']):
+    a run without API keys or network is retried next time instead of being replayed.
+    """
+    @functools.wraps(func)
+    def wrapper(company_name: str, company_data: str) -> Dict:
+        key = make_web_cache_key(company_name, company_data)
+        web_data = load_web_data(key)
+        if web_data is not None:
+            print(f"⚡ Using cached web data for '{company_name}'")
+            return web_data
+
+        web_data = func(company_name, company_data)
+        if web_data.get('web_ok'):
+            save_web_data(key, web_data)
+        return web_data
+
+    return wrapper
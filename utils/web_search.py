@@ -11,89 +11,201 @@ All searches use AI-generated queries based on company data for better relevance
 """
 
 import os
-import json
-import requests
+import re
+import time
+import asyncio
+from functools import lru_cache
+from urllib.parse import urlsplit
+import aiohttp
 from typing import List, Dict, Optional, Tuple
 from PIL import Image
 import io
-import time
-import random
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
+from utils import serde
+from utils.web_cache import cached_web_search, make_http_cache_key, load_http_response, save_http_response
+from utils.llm_cache import make_cache_key, get_cached_response, store_response
 
 # Load environment variables
 load_dotenv()
 
-def clean_json_string(json_string):
-    """Cleans the LLM output to ensure it is valid JSON."""
-    if "```" in json_string:
-        json_string = json_string.replace("```json", "").replace("```", "")
-    return json_string.strip()
+# HTTP settings for the Unsplash/Tavily searches
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+UNSPLASH_SEARCH_URL = "https://api.unsplash.com/search/photos"
+HTTP_TIMEOUT_SECONDS = 15
+MAX_CONCURRENT_REQUESTS = 10
 
-def generate_search_queries(company_name: str, company_data: str, search_type: str) -> List[str]:
-    """
-    Uses LLM to generate intelligent search queries based on company data.
-    
-    Args:
-        company_name: Actual company name (will be anonymized in queries)
-        company_data: Extracted text from company documents
-        search_type: Type of search ("images", "certifications", "business_info", "partners")
-    
-    Returns:
-        List of search query strings
-    """
-    print(f"🤖 Generating {search_type} search queries using AI...")
+# Retry policy for transient HTTP failures: waits 0.3s, 0.6s, 1.2s between attempts
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 429s back off harder (1s, 2s, 4s) unless the server sends Retry-After
+HTTP_429_BACKOFF_FACTOR = 1.0
+# A Retry-After longer than this (seconds) is not waited out: the 429 is returned instead
+HTTP_MAX_RETRY_AFTER_SECONDS = 10
+
+# Per-host token bucket: bursts of up to 10 requests, then 10 per second
+RATE_LIMIT_PER_SECOND = 10
+RATE_LIMIT_BURST = 10
+_RATE_LIMIT_TAT: Dict[str, float] = {}  # host -> theoretical arrival time of the next request
+
+# HTTP settings for image downloads
+IMAGE_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+IMAGE_DOWNLOAD_CONNECTIONS = 20
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Generated search queries are reused from the LLM cache for a day
+SEARCH_QUERY_CACHE_TTL_SECONDS = 86400
+
+# Stop scanning Tavily results once this many certifications have been found
+MAX_WEB_CERTIFICATIONS = 3
+
+# Certifications looked for in company data and search results
+_COMMON_CERTS: Tuple[str, ...] = (
+    "ISO 9001", "ISO 14001", "ISO 22000", "ISO 13485", "ISO 45001",
+    "GMP", "WHO-GMP", "USFDA", "CE Mark", "FSSAI", "BIS", "BRC",
+    "FSSC 22000", "HACCP", "OHSAS 18001", "IATF 16949", "TS 16949",
+    "USDA Organic", "Non-GMO", "RoHS", "FCC", "AEO", "GDP", "C-TPAT"
+)
+# All names in one case-insensitive alternation (longest first, so "WHO-GMP" wins over "GMP"),
+# matched as whole words so e.g. "BIS" is not found inside "business"
+_CERT_RE = re.compile(
+    r"\b(" + "|".join(re.escape(cert) for cert in sorted(_COMMON_CERTS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
+_CERT_BY_LOWER: Dict[str, str] = {cert.lower(): cert for cert in _COMMON_CERTS}
+
+def _find_certs(text: str) -> List[str]:
+    """Returns the certifications mentioned in text (any case, whole words), in _COMMON_CERTS order."""
+    found = {_CERT_BY_LOWER[m.group(1).lower()] for m in _CERT_RE.finditer(text)}
+    return [cert for cert in _COMMON_CERTS if cert in found]
+
+# Static instructions first, then the per-company data, then the per-call search type:
+# the four calls for one company share the longest possible prefix (Gemini implicit caching)
+SEARCH_QUERY_PROMPT_TEMPLATE = """
+    You are a research assistant helping to find information about a company for an M&A investment teaser.
     
-    llm = ChatGoogleGenerativeAI(
-        model="models/gemini-2.5-flash-lite",
-        temperature=0.7,
-        google_api_key=os.getenv("GOOGLE_API_KEY")
-    )
+    IMPORTANT RULES:
+    1. For images: Generate queries for generic, anonymized images (NO company logos or names)
+       - Focus on: products, manufacturing facilities, R&D labs, packaging
+       - Use generic terms like "specialty chemicals manufacturing facility" not "<company name> factory"
+    2. For certifications: Extract certification names mentioned in data, or generate queries for industry-standard certifications
+    3. For business_info: Generate queries about market trends, industry analysis, growth opportunities
+    4. For partners: Generate queries about business partnerships, clients, suppliers in the industry
     
-    prompt_template = """
-    You are a research assistant helping to find information about a company for an M&A investment teaser.
+    Return ONLY a JSON array of query strings, no other text:
+    ["query 1", "query 2", "query 3"]
     
     Company Name: {company_name}
     Company Data Summary: {company_data}
     
-    Task: Generate 3-5 specific search queries for finding {search_type} information.
+    Task: Generate {query_count} specific search queries for finding {search_type} information.
+    """
+_SEARCH_QUERY_PROMPT = PromptTemplate(
+    input_variables=["company_name", "company_data", "search_type", "query_count"],
+    template=SEARCH_QUERY_PROMPT_TEMPLATE
+)
+
+# One call for every search type: same static rules, then the company data, then the task
+ALL_SEARCH_QUERIES_PROMPT_TEMPLATE = """
+    You are a research assistant helping to find information about a company for an M&A investment teaser.
     
     IMPORTANT RULES:
     1. For images: Generate queries for generic, anonymized images (NO company logos or names)
        - Focus on: products, manufacturing facilities, R&D labs, packaging
-       - Use generic terms like "specialty chemicals manufacturing facility" not "{company_name} factory"
+       - Use generic terms like "specialty chemicals manufacturing facility" not "<company name> factory"
     2. For certifications: Extract certification names mentioned in data, or generate queries for industry-standard certifications
     3. For business_info: Generate queries about market trends, industry analysis, growth opportunities
     4. For partners: Generate queries about business partnerships, clients, suppliers in the industry
+    5. Do not repeat the same query under more than one key
     
-    Return ONLY a JSON array of query strings, no other text:
-    ["query 1", "query 2", "query 3"]
-    """
+    Return ONLY a JSON object with these keys, no other text:
+    {{"images": ["query 1", "query 2"], "certifications": ["query 1"], "business_info": ["query 1", "query 2"], "partners": ["query 1", "query 2"]}}
     
-    prompt = PromptTemplate(
-        input_variables=["company_name", "company_data", "search_type"],
-        template=prompt_template
+    Company Name: {company_name}
+    Company Data Summary: {company_data}
+    
+    Task: Generate 2-3 specific search queries for each of images, business_info and partners, and 1 for certifications.
+    """
+_ALL_SEARCH_QUERIES_PROMPT = PromptTemplate(
+    input_variables=["company_name", "company_data"],
+    template=ALL_SEARCH_QUERIES_PROMPT_TEMPLATE
+)
+SEARCH_TYPES: Tuple[str, ...] = ("images", "certifications", "business_info", "partners")
+
+# Gemini structured output: the response is guaranteed to be JSON matching these schemas
+_QUERY_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+_ALL_QUERIES_SCHEMA = {
+    "type": "object",
+    "properties": {search_type: _QUERY_LIST_SCHEMA for search_type in SEARCH_TYPES},
+    "required": list(SEARCH_TYPES)
+}
+
+@lru_cache(maxsize=1)
+def _get_llm():
+    """Builds the Gemini client once; every generate_search_queries call reuses it."""
+    return ChatGoogleGenerativeAI(
+        model="models/gemini-2.5-flash-lite",
+        temperature=0.7,
+        google_api_key=os.getenv("GOOGLE_API_KEY"),
+        response_mime_type="application/json"
     )
+
+@lru_cache(maxsize=1)
+def _get_search_query_chain():
+    """Composes the query-generation prompt | llm chain once (RunnableSequence is stateless)."""
+    return _SEARCH_QUERY_PROMPT | _get_llm().bind(response_schema=_QUERY_LIST_SCHEMA)
+
+@lru_cache(maxsize=1)
+def _get_all_search_queries_chain():
+    """Composes the combined query-generation prompt | llm chain once."""
+    return _ALL_SEARCH_QUERIES_PROMPT | _get_llm().bind(response_schema=_ALL_QUERIES_SCHEMA)
+
+def generate_search_queries(company_name: str, company_data: str, search_type: str, n_queries: int = 5) -> List[str]:
+    """
+    Uses LLM to generate intelligent search queries based on company data.
+    
+    Args:
+        company_name: Actual company name (will be anonymized in queries)
+        company_data: Extracted text from company documents
+        search_type: Type of search ("images", "certifications", "business_info", "partners")
+        n_queries: Maximum number of queries to return (fewer = shorter LLM response)
+    
+    Returns:
+        List of search query strings
+    """
+    # Truncate company_data if too long (keep first 2000 chars for context)
+    truncated_data = company_data[:2000] if len(company_data) > 2000 else company_data
+    
+    # Same company, same (truncated) data, same search type -> reuse the queries from the LLM cache
+    cache_key = make_cache_key(f"search_queries|{search_type}|{n_queries}|{company_name}|{truncated_data}")
+    cached = get_cached_response(cache_key, max_age_seconds=SEARCH_QUERY_CACHE_TTL_SECONDS)
+    if cached is not None:
+        print(f"⚡ Using cached {search_type} search queries")
+        return serde.loads(cached)
+    
+    print(f"🤖 Generating {search_type} search queries using AI...")
     
     try:
-        # Truncate company_data if too long (keep first 2000 chars for context)
-        truncated_data = company_data[:2000] if len(company_data) > 2000 else company_data
-        
-        chain = prompt | llm
-        response = chain.invoke({
+        response = _get_search_query_chain().invoke({
             "company_name": company_name,
             "company_data": truncated_data,
-            "search_type": search_type
+            "search_type": search_type,
+            "query_count": "3-5" if n_queries >= 5 else str(n_queries)
         })
         
+        # Structured output: the content is a bare JSON array, no fences to strip
         content = response.content if hasattr(response, 'content') else str(response)
-        cleaned_json = clean_json_string(content)
-        queries = json.loads(cleaned_json)
+        queries = serde.loads(content)
         
         if isinstance(queries, list) and len(queries) > 0:
             print(f"✅ Generated {len(queries)} queries")
-            return queries[:5]  # Limit to 5 queries max
+            queries = queries[:n_queries]
+            store_response(cache_key, serde.dumps(queries).decode('utf-8'))
+            return queries
         else:
             print("⚠️  LLM returned invalid format, using fallback queries")
             return generate_fallback_queries(search_type)
@@ -102,6 +214,70 @@ def generate_search_queries(company_name: str, company_data: str, search_type: s
         print(f"⚠️  Query generation error: {e}, using fallback")
         return generate_fallback_queries(search_type)
 
+def _dedupe_queries(queries_by_type: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Drops queries already used by an earlier search type (compared case- and whitespace-insensitively)."""
+    seen = set()
+    unique = {}
+    for search_type in SEARCH_TYPES:
+        unique[search_type] = []
+        for query in queries_by_type.get(search_type, []):
+            key = " ".join(query.lower().split())
+            if key and key not in seen:
+                seen.add(key)
+                unique[search_type].append(query)
+    return unique
+
+def generate_all_search_queries(company_name: str, company_data: str) -> Dict[str, List[str]]:
+    """
+    Generates the queries for every search type with a single LLM call.
+    
+    Args:
+        company_name: Actual company name (will be anonymized in queries)
+        company_data: Extracted text from company documents
+    
+    Returns:
+        Dict mapping each of SEARCH_TYPES to its list of query strings (deduplicated across types)
+    """
+    truncated_data = company_data[:2000] if len(company_data) > 2000 else company_data
+    
+    cache_key = make_cache_key(f"all_search_queries|{company_name}|{truncated_data}")
+    cached = get_cached_response(cache_key, max_age_seconds=SEARCH_QUERY_CACHE_TTL_SECONDS)
+    if cached is not None:
+        print("⚡ Using cached search queries")
+        return serde.loads(cached)
+    
+    print("🤖 Generating search queries using AI...")
+    
+    try:
+        response = _get_all_search_queries_chain().invoke({
+            "company_name": company_name,
+            "company_data": truncated_data
+        })
+        
+        content = response.content if hasattr(response, 'content') else str(response)
+        parsed = serde.loads(content)
+        if not isinstance(parsed, dict):
+            print("⚠️  LLM returned invalid format, using fallback queries")
+            return {search_type: generate_fallback_queries(search_type) for search_type in SEARCH_TYPES}
+        
+        queries_by_type = {}
+        for search_type in SEARCH_TYPES:
+            queries = parsed.get(search_type)
+            queries_by_type[search_type] = [q for q in queries if isinstance(q, str) and q.strip()][:5] if isinstance(queries, list) else []
+        
+        # Dedupe first, so a type whose queries all repeat another type's still gets fallbacks
+        queries_by_type = _dedupe_queries(queries_by_type)
+        for search_type, queries in queries_by_type.items():
+            if not queries:
+                queries_by_type[search_type] = generate_fallback_queries(search_type)
+        print(f"✅ Generated {sum(len(q) for q in queries_by_type.values())} queries")
+        store_response(cache_key, serde.dumps(queries_by_type).decode('utf-8'))
+        return queries_by_type
+        
+    except Exception as e:
+        print(f"⚠️  Query generation error: {e}, using fallback")
+        return {search_type: generate_fallback_queries(search_type) for search_type in SEARCH_TYPES}
+
 def generate_fallback_queries(search_type: str) -> List[str]:
     """Fallback queries if LLM generation fails."""
     fallbacks = {
@@ -112,13 +288,95 @@ def generate_fallback_queries(search_type: str) -> List[str]:
     }
     return fallbacks.get(search_type, ["general search"])
 
-def search_text_tavily(query: str, max_results: int = 5) -> List[Dict]:
+def _new_session() -> aiohttp.ClientSession:
+    """One pooled session per web search run; the connector limit caps concurrent requests."""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+        connector=aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, ttl_dns_cache=300)
+    )
+
+async def _wait_for_rate_limit(host: str) -> None:
+    """
+    Token bucket per host (GCRA form: one timestamp per host, no lock needed on the event loop).
+    Sleeps only when the host's burst allowance is used up.
+    """
+    interval = 1.0 / RATE_LIMIT_PER_SECOND
+    now = time.monotonic()
+    tat = max(_RATE_LIMIT_TAT.get(host, now), now)
+    _RATE_LIMIT_TAT[host] = tat + interval
+    delay = tat - now - (RATE_LIMIT_BURST - 1) * interval
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+def _retry_delay(response: Optional[aiohttp.ClientResponse], attempt: int) -> Optional[float]:
+    """
+    Backoff before the next attempt; 429s honour a numeric Retry-After header.
+    Returns None (don't retry) when Retry-After exceeds HTTP_MAX_RETRY_AFTER_SECONDS.
+    """
+    if response is not None and response.status == 429:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= HTTP_MAX_RETRY_AFTER_SECONDS else None
+        return HTTP_429_BACKOFF_FACTOR * (2 ** attempt)
+    return HTTP_BACKOFF_FACTOR * (2 ** attempt)
+
+async def _send_with_retry(session: aiohttp.ClientSession, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+    """
+    Sends a request over the pooled session, rate limited per host, retrying connection errors,
+    timeouts and HTTP_RETRY_STATUSES with exponential backoff. The last response is returned as-is,
+    so the caller still calls raise_for_status() (use it with `async with`).
+    """
+    host = urlsplit(url).hostname or ''
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        await _wait_for_rate_limit(host)
+        response = None
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == HTTP_MAX_RETRIES:
+                raise
+        else:
+            if response.status not in HTTP_RETRY_STATUSES or attempt == HTTP_MAX_RETRIES:
+                return response
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response
+        if response is not None:
+            response.release()
+        await asyncio.sleep(delay)
+
+async def _cached_json_request(session: aiohttp.ClientSession, method: str, url: str, cache_params: Dict, **kwargs) -> Dict:
+    """
+    Sends an API request through _send_with_retry() and returns the decoded JSON body,
+    reusing a cached response for the same method + URL + cache_params for a day.
+    Raises aiohttp.ClientResponseError on HTTP errors (which are never cached).
+    """
+    cache_key = make_http_cache_key(method, url, cache_params)
+    data = load_http_response(cache_key)
+    if data is not None:
+        return data
+    
+    async with await _send_with_retry(session, method, url, **kwargs) as response:
+        response.raise_for_status()
+        # orjson straight from the body bytes (skips aiohttp's str decode + stdlib json)
+        data = serde.loads(await response.read())
+    save_http_response(cache_key, data)
+    return data
+
+async def _run_with_session(coro_fn, *args, **kwargs):
+    """Runs an *_async search function with its own short-lived session (used by the sync wrappers)."""
+    async with _new_session() as session:
+        return await coro_fn(session, *args, **kwargs)
+
+async def search_text_tavily_async(session: aiohttp.ClientSession, query: str, max_results: int = 5) -> List[Dict]:
     """
     Search using Tavily API - better for business/research queries.
     Free tier: 1,000 searches/month
     Get API key at https://tavily.com (free signup)
     
     Args:
+        session: Shared aiohttp session
         query: Search query string
         max_results: Maximum number of results
     
@@ -130,7 +388,6 @@ def search_text_tavily(query: str, max_results: int = 5) -> List[Dict]:
         print("   ⚠️  TAVILY_API_KEY not found. Skipping search.")
         return []
     
-    url = "https://api.tavily.com/search"
     headers = {"Content-Type": "application/json"}
     payload = {
         "api_key": api_key,
@@ -142,9 +399,9 @@ def search_text_tavily(query: str, max_results: int = 5) -> List[Dict]:
     }
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        # The API key is left out of the cache key so cached responses survive key rotation
+        cache_params = {k: v for k, v in payload.items() if k != "api_key"}
+        data = await _cached_json_request(session, 'POST', TAVILY_SEARCH_URL, cache_params, data=serde.dumps(payload), headers=headers)
         
         results = []
         for item in data.get('results', []):
@@ -155,22 +412,97 @@ def search_text_tavily(query: str, max_results: int = 5) -> List[Dict]:
             })
         
         return results
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"   ⚠️  Tavily API error: {e}")
         return []
     except Exception as e:
         print(f"   ⚠️  Tavily unexpected error: {e}")
         return []
 
-def search_images(company_name: str, company_data: str, max_results: int = 5) -> Tuple[List[Dict], List[Dict]]:
+def search_text_tavily(query: str, max_results: int = 5) -> List[Dict]:
+    """Sync wrapper around search_text_tavily_async()."""
+    return asyncio.run(_run_with_session(search_text_tavily_async, query, max_results))
+
+async def _fetch_unsplash(session: aiohttp.ClientSession, query: str, max_results: int, prefer_full: bool = False) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Runs one Unsplash photo search. Returns (images, citations); empty on errors.
+    Only the 'regular' size URL is kept unless prefer_full also asks for the full-resolution one.
+    """
+    images = []
+    citations = []
+    
+    # Optional: Use Unsplash API key if available (increases rate limit)
+    # Get free key at https://unsplash.com/developers
+    unsplash_key = os.getenv("UNSPLASH_ACCESS_KEY", None)
+    
+    try:
+        headers = {
+            "Accept-Version": "v1"
+        }
+        
+        # Add Authorization header if API key is available
+        if unsplash_key:
+            headers["Authorization"] = f"Client-ID {unsplash_key}"
+        
+        params = {
+            "query": query,
+            "per_page": max_results,
+            "orientation": "landscape",  # Better for presentations
+            "content_filter": "high"  # High quality only
+        }
+        
+        data = await _cached_json_request(session, 'GET', UNSPLASH_SEARCH_URL, params, headers=headers, params=params)
+        
+        for photo in data.get('results', []):
+            # Use 'regular' size for good quality without being too large
+            image_url = photo['urls']['regular']
+            
+            # Get description or alt text
+            title = photo.get('description') or photo.get('alt_description') or 'Stock Photo'
+            photographer = photo['user']['name']
+            photographer_url = photo['user']['links']['html']
+            
+            image = {
+                'url': image_url,
+                'title': title,
+                'source': photo['links']['html'],
+                'photographer': photographer,
+                'photographer_url': photographer_url,
+                'type': 'generic'
+            }
+            if prefer_full:
+                image['download_url'] = photo['urls']['full']  # Full resolution (5-10x the bytes)
+            images.append(image)
+            citations.append({
+                'type': 'image',
+                'url': image_url,
+                'source': photo['links']['html'],
+                'description': f"Stock photo from Unsplash: {query}",
+                'photographer': photographer,
+                'photographer_url': photographer_url
+            })
+        
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"   ⚠️  Unsplash API error: {e}")
+    except Exception as e:
+        print(f"   ⚠️  Unexpected error: {e}")
+    
+    return images, citations
+
+async def search_images_async(session: aiohttp.ClientSession, company_name: str, company_data: str, max_results: int = 5, queries: Optional[List[str]] = None,
+                              prefer_full: bool = False) -> Tuple[List[Dict], List[Dict]]:
     """
     Searches for high-quality, generic stock images using Unsplash API.
     No API key required for basic usage - perfect for presentation-quality images.
+    All queries are sent concurrently.
     
     Args:
+        session: Shared aiohttp session
         company_name: Company name (for context, not used in queries)
         company_data: Extracted company data
         max_results: Maximum images per query
+        queries: Pre-generated queries (from generate_all_search_queries); generated here if None
+        prefer_full: Also return each photo's full-resolution 'download_url' (not needed for slides)
     
     Returns:
         Tuple of (images list, citations list)
@@ -178,91 +510,36 @@ def search_images(company_name: str, company_data: str, max_results: int = 5) ->
     print(f"🖼️  Searching for high-quality stock images (Unsplash)...")
     
     # Generate queries using LLM
-    queries = generate_search_queries(company_name, company_data, "images")
+    if queries is None:
+        queries = await asyncio.to_thread(generate_search_queries, company_name, company_data, "images")
     queries = queries[:2]  # Use first 2 queries
     
-    all_results = []
-    citations = []
-    
-    # Optional: Use Unsplash API key if available (increases rate limit)
-    # Get free key at https://unsplash.com/developers
-    unsplash_key = os.getenv("UNSPLASH_ACCESS_KEY", None)
-    
     for i, query in enumerate(queries):
         print(f"   🔍 Query {i+1}/{len(queries)}: '{query}'")
-        
-        try:
-            # Unsplash API endpoint
-            url = "https://api.unsplash.com/search/photos"
-            headers = {
-                "Accept-Version": "v1"
-            }
-            
-            # Add Authorization header if API key is available
-            if unsplash_key:
-                headers["Authorization"] = f"Client-ID {unsplash_key}"
-            
-            params = {
-                "query": query,
-                "per_page": max_results,
-                "orientation": "landscape",  # Better for presentations
-                "content_filter": "high"  # High quality only
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            for photo in data.get('results', []):
-                # Use 'regular' size for good quality without being too large
-                image_url = photo['urls']['regular']
-                # Store full resolution URL for actual download if needed
-                download_url = photo['urls']['full']
-                
-                # Get description or alt text
-                title = photo.get('description') or photo.get('alt_description') or 'Stock Photo'
-                photographer = photo['user']['name']
-                photographer_url = photo['user']['links']['html']
-                
-                all_results.append({
-                    'url': image_url,
-                    'download_url': download_url,  # Full resolution for download
-                    'title': title,
-                    'source': photo['links']['html'],
-                    'photographer': photographer,
-                    'photographer_url': photographer_url,
-                    'type': 'generic'
-                })
-                citations.append({
-                    'type': 'image',
-                    'url': image_url,
-                    'source': photo['links']['html'],
-                    'description': f"Stock photo from Unsplash: {query}",
-                    'photographer': photographer,
-                    'photographer_url': photographer_url
-                })
-            
-            # Small delay between queries (no rate limit issues with Unsplash)
-            if i < len(queries) - 1:
-                time.sleep(0.5)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"   ⚠️  Unsplash API error: {e}")
-            continue
-        except Exception as e:
-            print(f"   ⚠️  Unexpected error: {e}")
-            continue
+    
+    all_results = []
+    citations = []
+    for images, image_citations in await asyncio.gather(*[_fetch_unsplash(session, q, max_results, prefer_full) for q in queries]):
+        all_results.extend(images)
+        citations.extend(image_citations)
     
     print(f"✅ Found {len(all_results)} high-quality images")
     return all_results[:max_results * 2], citations
 
-def search_certifications(company_name: str, company_data: str) -> Tuple[List[Dict], List[Dict]]:
+def search_images(company_name: str, company_data: str, max_results: int = 5, queries: Optional[List[str]] = None,
+                  prefer_full: bool = False) -> Tuple[List[Dict], List[Dict]]:
+    """Sync wrapper around search_images_async()."""
+    return asyncio.run(_run_with_session(search_images_async, company_name, company_data, max_results, queries, prefer_full))
+
+async def search_certifications_async(session: aiohttp.ClientSession, company_name: str, company_data: str, queries: Optional[List[str]] = None) -> Tuple[List[Dict], List[Dict]]:
     """
     Searches for certifications mentioned in company data or relevant to the industry.
     
     Args:
+        session: Shared aiohttp session
         company_name: Company name
         company_data: Extracted company data
+        queries: Pre-generated queries (from generate_all_search_queries); generated here if None
     
     Returns:
         Tuple of (certifications list, citations list)
@@ -272,36 +549,28 @@ def search_certifications(company_name: str, company_data: str) -> Tuple[List[Di
     certifications = []
     citations = []
     
-    # First, extract certifications from company data
-    company_data_lower = company_data.lower()
-    common_certs = [
-        "ISO 9001", "ISO 14001", "ISO 22000", "ISO 13485", "ISO 45001",
-        "GMP", "WHO-GMP", "USFDA", "CE Mark", "FSSAI", "BIS", "BRC",
-        "FSSC 22000", "HACCP", "OHSAS 18001", "IATF 16949", "TS 16949",
-        "USDA Organic", "Non-GMO", "RoHS", "FCC", "AEO", "GDP", "C-TPAT"
-    ]
-    
-    found_certs = []
-    for cert in common_certs:
-        if cert.lower() in company_data_lower:
-            found_certs.append(cert)
-            certifications.append({
-                'name': cert,
-                'description': f"{cert} certification standard",
-                'verified': True,
-                'source': 'company_data'
-            })
-            citations.append({
-                'type': 'certification',
-                'name': cert,
-                'source': 'company_data',
-                'description': f"Certification mentioned in provided company data"
-            })
+    # First, extract certifications from company data (single regex scan, no lowercased copy)
+    found_certs = set()
+    for cert in _find_certs(company_data):
+        found_certs.add(cert)
+        certifications.append({
+            'name': cert,
+            'description': f"{cert} certification standard",
+            'verified': True,
+            'source': 'company_data'
+        })
+        citations.append({
+            'type': 'certification',
+            'name': cert,
+            'source': 'company_data',
+            'description': f"Certification mentioned in provided company data"
+        })
     
-    # Skip web search for certifications if we already found some (to avoid rate limits)
-    # Only search if we found very few certifications
+    # Skip web search for certifications if we already found some (no LLM or network calls)
     if len(found_certs) == 0:
-        queries = generate_search_queries(company_name, company_data, "certifications")
+        # Only the first query is ever used, so ask the LLM for just one
+        if queries is None:
+            queries = await asyncio.to_thread(generate_search_queries, company_name, company_data, "certifications", 1)
         
         try:
             # Only use first query
@@ -310,27 +579,31 @@ def search_certifications(company_name: str, company_data: str) -> Tuple[List[Di
                 print(f"   🔍 Query: '{query}'")
                 
                 # Use Tavily for search
-                results = search_text_tavily(query, max_results=3)
+                results = await search_text_tavily_async(session, query, max_results=3)
                 
                 for result in results:
-                    body_lower = result.get('body', '').lower()
-                    # Try to extract certification names from results
-                    for cert in common_certs:
-                        if cert.lower() in body_lower and cert not in found_certs:
-                            found_certs.append(cert)
-                            certifications.append({
-                                'name': cert,
-                                'description': result.get('body', '')[:200],
-                                'verified': False,
-                                'source': result.get('href', '')
-                            })
-                            citations.append({
-                                'type': 'certification',
-                                'name': cert,
-                                'source': result.get('href', ''),
-                                'description': f"Information about {cert} certification"
-                            })
+                    if len(found_certs) >= MAX_WEB_CERTIFICATIONS:
+                        break
+                    body = result.get('body', '')
+                    # Every certification named in the result, in one case-insensitive scan
+                    for cert in _find_certs(body):
+                        if cert in found_certs:
+                            continue
+                        if len(found_certs) >= MAX_WEB_CERTIFICATIONS:
                             break
+                        found_certs.add(cert)
+                        certifications.append({
+                            'name': cert,
+                            'description': body[:200],
+                            'verified': False,
+                            'source': result.get('href', '')
+                        })
+                        citations.append({
+                            'type': 'certification',
+                            'name': cert,
+                            'source': result.get('href', ''),
+                            'description': f"Information about {cert} certification"
+                        })
                     
         except Exception as e:
             print(f"⚠️  Certification web search error: {e}")
@@ -338,14 +611,37 @@ def search_certifications(company_name: str, company_data: str) -> Tuple[List[Di
     print(f"✅ Found {len(certifications)} certifications")
     return certifications, citations
 
-def search_business_info(company_name: str, company_data: str, max_results: int = 5) -> Dict:
+def search_certifications(company_name: str, company_data: str, queries: Optional[List[str]] = None) -> Tuple[List[Dict], List[Dict]]:
+    """Sync wrapper around search_certifications_async()."""
+    return asyncio.run(_run_with_session(search_certifications_async, company_name, company_data, queries))
+
+def _to_info_items(search_results: List[Dict], citation_type: str, results: Dict, field: str) -> None:
+    """Appends Tavily results to results[field] as snippets, plus one citation each."""
+    for result in search_results:
+        results[field].append({
+            'title': result.get('title', ''),
+            'snippet': result.get('body', '')[:300],
+            'url': result.get('href', '')
+        })
+        results['citations'].append({
+            'type': citation_type,
+            'url': result.get('href', ''),
+            'description': result.get('title', '')
+        })
+
+async def search_business_info_async(session: aiohttp.ClientSession, company_name: str, company_data: str, max_results: int = 5,
+                                     business_queries: Optional[List[str]] = None, partner_queries: Optional[List[str]] = None) -> Dict:
     """
     Searches for business information like market trends, partners, industry insights.
+    The market and partner searches run concurrently.
     
     Args:
+        session: Shared aiohttp session
         company_name: Company name
         company_data: Extracted company data
         max_results: Maximum results per query
+        business_queries: Pre-generated business_info queries; generated here if None
+        partner_queries: Pre-generated partners queries; generated here if None
     
     Returns:
         Dict with 'market_info', 'partners', 'trends' and citations
@@ -360,53 +656,31 @@ def search_business_info(company_name: str, company_data: str, max_results: int
     }
     
     # Generate queries for business info (limit to 1 query each to avoid rate limits)
-    business_queries = generate_search_queries(company_name, company_data, "business_info")
-    partner_queries = generate_search_queries(company_name, company_data, "partners")
+    async def _queries_for(queries: Optional[List[str]], search_type: str) -> List[str]:
+        if queries is not None:
+            return queries
+        return await asyncio.to_thread(generate_search_queries, company_name, company_data, search_type)
+    
+    business_queries, partner_queries = await asyncio.gather(
+        _queries_for(business_queries, "business_info"),
+        _queries_for(partner_queries, "partners")
+    )
+    
+    async def _first_query_results(queries: List[str]) -> List[Dict]:
+        if not queries:
+            return []
+        print(f"   🔍 Query: '{queries[0]}'")
+        # Use Tavily for search
+        return await search_text_tavily_async(session, queries[0], max_results=max_results)
     
     try:
-        # Search for market information (only 1 query)
-        if business_queries:
-            query = business_queries[0]
-            print(f"   🔍 Query: '{query}'")
-            
-            # Use Tavily for search
-            search_results = search_text_tavily(query, max_results=max_results)
-            
-            for result in search_results:
-                results['market_info'].append({
-                    'title': result.get('title', ''),
-                    'snippet': result.get('body', '')[:300],
-                    'url': result.get('href', '')
-                })
-                results['citations'].append({
-                    'type': 'market_info',
-                    'url': result.get('href', ''),
-                    'description': result.get('title', '')
-                })
-            
-            # Small delay before next search
-            time.sleep(1)
-        
-        # Search for partners information (only 1 query)
-        if partner_queries:
-            query = partner_queries[0]
-            print(f"   🔍 Query: '{query}'")
-            
-            # Try Tavily first
-            search_results = search_text_tavily(query, max_results=max_results)
-            
-            
-            for result in search_results:
-                results['partners'].append({
-                    'title': result.get('title', ''),
-                    'snippet': result.get('body', '')[:300],
-                    'url': result.get('href', '')
-                })
-                results['citations'].append({
-                    'type': 'partner',
-                    'url': result.get('href', ''),
-                    'description': result.get('title', '')
-                })
+        # Search for market and partners information (only 1 query each)
+        market_results, partner_results = await asyncio.gather(
+            _first_query_results(business_queries),
+            _first_query_results(partner_queries)
+        )
+        _to_info_items(market_results, 'market_info', results, 'market_info')
+        _to_info_items(partner_results, 'partner', results, 'partners')
         
         print(f"✅ Found {len(results['market_info'])} market info items and {len(results['partners'])} partner items")
         return results
@@ -415,11 +689,47 @@ def search_business_info(company_name: str, company_data: str, max_results: int
         print(f"❌ Business info search failed: {e}")
         return results
 
-def download_image(image_url: str, save_path: str, max_size_mb: float = 2.0) -> bool:
+def search_business_info(company_name: str, company_data: str, max_results: int = 5,
+                         business_queries: Optional[List[str]] = None, partner_queries: Optional[List[str]] = None) -> Dict:
+    """Sync wrapper around search_business_info_async()."""
+    return asyncio.run(_run_with_session(search_business_info_async, company_name, company_data, max_results,
+                                         business_queries, partner_queries))
+
+def _process_and_save(image_data: bytearray, save_path: str) -> None:
+    """Validates, normalizes and saves downloaded image bytes as JPEG (CPU-bound, runs in an executor)."""
+    # Image.open only parses the header here; pixels are decoded lazily
+    img = Image.open(io.BytesIO(image_data))
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    
+    # Fast path: already a JPEG within the size limit (e.g. Unsplash 'regular') -> keep the original bytes
+    max_dimension = 1920
+    if img.format == 'JPEG' and img.width <= max_dimension and img.height <= max_dimension:
+        img.verify()
+        with open(save_path, 'wb') as f:
+            f.write(image_data)
+        return
+    
+    # Large JPEGs: let libjpeg decode at 1/2, 1/4 or 1/8 scale (still >= max_dimension); no-op for other formats
+    img.draft('RGB', (max_dimension, max_dimension))
+    
+    # Convert to RGB if necessary (for JPEG compatibility)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img = img.convert('RGB')
+    
+    # Final LANCZOS touch-up to the exact limit (max 1920x1080 for PPT)
+    if img.width > max_dimension or img.height > max_dimension:
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    
+    # Save image
+    img.save(save_path, 'JPEG', quality=85, optimize=True)
+
+async def download_image_async(session: aiohttp.ClientSession, image_url: str, save_path: str, max_size_mb: float = 2.0) -> bool:
     """
     Downloads an image from URL and validates it.
+    Decoding/re-encoding runs in the default executor so other downloads keep going.
     
     Args:
+        session: Shared aiohttp session
         image_url: URL of the image
         save_path: Local path to save the image
         max_size_mb: Maximum file size in MB
@@ -428,35 +738,26 @@ def download_image(image_url: str, save_path: str, max_size_mb: float = 2.0) ->
         True if successful, False otherwise
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(image_url, headers=headers, timeout=10, stream=True)
-        response.raise_for_status()
-        
-        # Check file size
-        content_length = response.headers.get('content-length')
-        if content_length and int(content_length) > max_size_mb * 1024 * 1024:
-            print(f"⚠️  Image too large ({int(content_length) / 1024 / 1024:.2f} MB), skipping...")
-            return False
-        
-        # Download and validate image
-        image_data = response.content
-        img = Image.open(io.BytesIO(image_data))
-        
-        # Convert to RGB if necessary (for JPEG compatibility)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            img = img.convert('RGB')
-        
-        # Resize if too large (max 1920x1080 for PPT)
-        max_dimension = 1920
-        if img.width > max_dimension or img.height > max_dimension:
-            img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+        async with await _send_with_retry(session, 'GET', image_url, headers=IMAGE_REQUEST_HEADERS) as response:
+            response.raise_for_status()
+            
+            # Check file size
+            max_bytes = max_size_mb * 1024 * 1024
+            content_length = response.content_length
+            if content_length and content_length > max_bytes:
+                print(f"⚠️  Image too large ({content_length / 1024 / 1024:.2f} MB), skipping...")
+                return False
+            
+            # Download image, giving up as soon as it passes the limit (Content-Length can be missing or wrong)
+            image_data = bytearray()
+            async for chunk in response.content.iter_chunked(IMAGE_DOWNLOAD_CHUNK_SIZE):
+                image_data += chunk
+                if len(image_data) > max_bytes:
+                    print(f"⚠️  Image too large (over {max_size_mb:.2f} MB), skipping...")
+                    return False
         
-        # Save image
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        img.save(save_path, 'JPEG', quality=85, optimize=True)
+        # Validate and save image
+        await asyncio.get_running_loop().run_in_executor(None, _process_and_save, image_data, save_path)
         
         print(f"✅ Downloaded image: {os.path.basename(save_path)}")
         return True
@@ -465,16 +766,43 @@ def download_image(image_url: str, save_path: str, max_size_mb: float = 2.0) ->
         print(f"❌ Failed to download image from {image_url}: {e}")
         return False
 
-def get_web_data_for_company(company_name: str, company_data: str) -> Dict:
+async def download_images_batch(urls_and_paths: List[Tuple[str, str]], max_size_mb: float = 2.0) -> List[bool]:
     """
-    Main function to gather all web data for a company using AI-generated queries.
+    Downloads many images concurrently over one pooled session.
+    
+    Args:
+        urls_and_paths: (image_url, save_path) pairs
+        max_size_mb: Maximum file size in MB (per image)
+    
+    Returns:
+        One success flag per pair, in input order
+    """
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+        connector=aiohttp.TCPConnector(limit=IMAGE_DOWNLOAD_CONNECTIONS, ttl_dns_cache=300)
+    ) as session:
+        return await asyncio.gather(*[
+            download_image_async(session, url, path, max_size_mb) for url, path in urls_and_paths
+        ])
+
+def download_image(image_url: str, save_path: str, max_size_mb: float = 2.0) -> bool:
+    """Sync wrapper around download_image_async() for a single image."""
+    return asyncio.run(download_images_batch([(image_url, save_path)], max_size_mb))[0]
+
+async def get_web_data_for_company_async(company_name: str, company_data: str) -> Dict:
+    """
+    Gathers all web data for a company using AI-generated queries.
+    All queries come from one LLM call; the image, certification and business info searches
+    then run concurrently over one shared session.
     
     Args:
         company_name: Actual company name (used for context, anonymized in queries)
         company_data: Raw extracted text from company documents
     
     Returns:
-        Comprehensive dict with images, certifications, business info, and citations
+        Comprehensive dict with images, certifications, business info, and citations, plus
+        'web_ok': True only if both the Unsplash and the Tavily searches returned results
+        (every search swallows its own errors, so this is how a failed/offline run shows up)
     """
     print(f"\n🌐 Starting comprehensive web search for company...")
     print("=" * 60)
@@ -486,36 +814,82 @@ def get_web_data_for_company(company_name: str, company_data: str) -> Dict:
         'citations': []
     }
     
-    # 1. Search for images
-    print("\n📸 Step 1/3: Searching for images...")
-    images, img_citations = search_images(company_name, company_data, max_results=3)
-    web_data['images'] = images
-    web_data['citations'].extend(img_citations)
+    # Queries for every search type in a single LLM call
+    queries = await asyncio.to_thread(generate_all_search_queries, company_name, company_data)
     
-    # Wait between major search types
-    print("\n⏳ Waiting before next search type...")
-    time.sleep(random.uniform(10, 15))
+    # 1-3. Images, certifications and business information, all at once
+    print("\n📸 Searching for images, 🏆 certifications and 📊 business information...")
+    async with _new_session() as session:
+        (images, img_citations), (certs, cert_citations), business_info = await asyncio.gather(
+            search_images_async(session, company_name, company_data, max_results=3, queries=queries['images']),
+            search_certifications_async(session, company_name, company_data, queries=queries['certifications']),
+            search_business_info_async(session, company_name, company_data,
+                                       business_queries=queries['business_info'],
+                                       partner_queries=queries['partners'])
+        )
     
-    # 2. Search for certifications
-    print("\n🏆 Step 2/3: Searching for certifications...")
-    certs, cert_citations = search_certifications(company_name, company_data)
+    web_data['images'] = images
     web_data['certifications'] = certs
-    web_data['citations'].extend(cert_citations)
-    
-    # Wait between major search types
-    print("\n⏳ Waiting before next search type...")
-    time.sleep(random.uniform(10, 15))
-    
-    # 3. Search for business information
-    print("\n📊 Step 3/3: Searching for business information...")
-    business_info = search_business_info(company_name, company_data)
     web_data['business_info'] = business_info
+    web_data['citations'].extend(img_citations)
+    web_data['citations'].extend(cert_citations)
     web_data['citations'].extend(business_info.get('citations', []))
+    # Certifications found in company_data need no network, so they don't count here
+    web_data['web_ok'] = bool(images) and bool(business_info.get('market_info') or business_info.get('partners'))
     
     print("=" * 60)
     print(f"✅ Web search complete. Found:")
     print(f"   - {len(web_data['images'])} images")
     print(f"   - {len(web_data['certifications'])} certifications")
     print(f"   - {len(web_data['citations'])} total citations")
+    if not web_data['web_ok']:
+        print("   ⚠️  Some web searches returned nothing (API keys, rate limits or network?)")
     
     return web_data
+
+@cached_web_search
+def get_web_data_for_company(company_name: str, company_data: str) -> Dict:
+    """
+    Main function to gather all web data for a company using AI-generated queries.
+    Results are cached on disk for 7 days (see utils/web_cache.py).
+    Sync entry point: runs get_web_data_for_company_async() on a fresh event loop.
+    
+    Args:
+        company_name: Actual company name (used for context, anonymized in queries)
+        company_data: Raw extracted text from company documents
+    
+    Returns:
+        Comprehensive dict with images, certifications, business info, and citations
+    """
+    return asyncio.run(get_web_data_for_company_async(company_name, company_data))
+
+
+def merge_web_data(primary: Dict, secondary: Dict) -> Dict:
+    """
+    Merges two get_web_data_for_company() results.
+    Items from `primary` come first; items from `secondary` are appended unless
+    they duplicate an existing URL (images/business info) or name (certifications).
+    
+    Returns:
+        New merged web data dict
+    """
+    def _merge(items_a: List[Dict], items_b: List[Dict], key: str) -> List[Dict]:
+        seen = {item.get(key) for item in items_a}
+        return items_a + [item for item in items_b if item.get(key) not in seen]
+    
+    primary_info = primary.get('business_info', {})
+    secondary_info = secondary.get('business_info', {})
+    business_info = {
+        field: _merge(primary_info.get(field, []), secondary_info.get(field, []), 'url')
+        for field in ('market_info', 'partners', 'trends', 'citations')
+    }
+    return {
+        'images': _merge(primary.get('images', []), secondary.get('images', []), 'url'),
+        'certifications': _merge(primary.get('certifications', []), secondary.get('certifications', []), 'name'),
+        'business_info': business_info,
+        'citations': primary.get('citations', []) + [
+            c for c in secondary.get('citations', []) if c not in primary.get('citations', [])
+        ],
+        # Usable if either search got through
+        'web_ok': bool(primary.get('web_ok') or secondary.get('web_ok'))
+    }